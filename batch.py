@@ -0,0 +1,93 @@
+# batch.py
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from io import BytesIO
+from PIL import Image
+from inference_service import QueueFullError
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tiff", ".tif")
+DECODE_ERRORS = (OSError, ValueError, Image.DecompressionBombError)
+BUSY_ERRORS = (QueueFullError, FutureTimeoutError)  # 서비스 과부하: 이미지 문제가 아니므로 호출자에게 전달
+
+# ======================
+# 일괄 분류 (여러 파일 / zip)
+# ======================
+def expand_uploads(files, max_files: int = 1000, max_entry_bytes: int = 50 << 20):
+    """(이름, 바이트) 목록에서 zip은 풀어서 이미지 항목만 모아 (항목들, [(이름, 오류)]) 반환.
+
+    손상된 zip과 압축 해제 크기가 `max_entry_bytes`를 넘는 항목(zip 폭탄 방지)은 건너뛰고 오류로 보고.
+    """
+    out, errors = [], []
+    for name, data in files:
+        if name.lower().endswith(".zip"):
+            try:
+                with zipfile.ZipFile(BytesIO(data)) as zf:
+                    for info in zf.infolist():
+                        if info.is_dir() or info.filename.startswith("__MACOSX/"): continue
+                        if not info.filename.lower().endswith(IMAGE_EXTS): continue
+                        entry = f"{name}/{info.filename}"
+                        if info.file_size > max_entry_bytes:
+                            errors.append((entry, f"압축 해제 크기 {info.file_size:,} bytes가 한도 {max_entry_bytes:,} bytes를 넘음"))
+                            continue
+                        try:
+                            out.append((entry, zf.read(info)))
+                        except (zipfile.BadZipFile, NotImplementedError, RuntimeError) as e:  # CRC 오류, 미지원 압축, 암호화
+                            errors.append((entry, str(e)))
+                            continue
+                        if len(out) >= max_files: return out, errors
+            except zipfile.BadZipFile as e:
+                errors.append((name, f"zip 파일을 열 수 없음: {e}"))
+        else:
+            out.append((name, data))
+        if len(out) >= max_files: return out, errors
+    return out, errors
+
+def result_row(name: str, result, labels: list) -> dict:
+    pred, pred_idx, probs = result
+    row = {"file": name, "pred": str(pred), "confidence": float(probs[int(pred_idx)])}
+    row.update({lbl: float(probs[i]) for i, lbl in enumerate(labels)})
+    return row
+
+def classify_in_batches(service, items: list, decode, batch_size: int = 16, workers: int = 4,
+                        timeout: float | None = None):
+    """배치 단위로 디코딩(스레드 풀) → `InferenceService`에 한 요청으로 추론. 배치마다 (결과 행들, [(이름, 오류)]) yield.
+
+    현재 배치를 추론하는 동안 다음 배치 디코딩이 미리 진행됨. 전처리/추론 중 오류가 나면
+    그 배치를 한 장씩 다시 돌려 실패한 이미지만 오류로 보고. 서비스의 `QueueFullError`와
+    `concurrent.futures.TimeoutError`는 그대로 호출자에게 전달.
+    """
+    labels = [str(x) for x in service.vocab]
+    chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        submit = lambda chunk: [(name, ex.submit(decode, b)) for name, b in chunk]
+        pending = submit(chunks[0]) if chunks else []
+        for k in range(len(chunks)):
+            current = pending
+            pending = submit(chunks[k + 1]) if k + 1 < len(chunks) else []
+            names, pils, errors = [], [], []
+            for name, fut in current:
+                try:
+                    pils.append(fut.result())
+                    names.append(name)
+                except DECODE_ERRORS as e:
+                    errors.append((name, str(e)))
+            try:
+                results = service.predict_batch(pils, timeout=timeout)
+            except BUSY_ERRORS:
+                raise
+            except Exception:
+                names, results = _predict_each(service, names, pils, errors, timeout)
+            yield [result_row(n, r, labels) for n, r in zip(names, results)], errors
+
+def _predict_each(service, names: list, pils: list, errors: list, timeout: float | None):
+    """한 장씩 추론해 성공한 (이름들, 결과들) 반환. 실패한 이미지는 errors에 추가."""
+    ok_names, results = [], []
+    for name, pil in zip(names, pils):
+        try:
+            results += service.predict_batch([pil], timeout=timeout)
+            ok_names.append(name)
+        except BUSY_ERRORS:
+            raise
+        except Exception as e:
+            errors.append((name, f"{type(e).__name__}: {e}"))
+    return ok_names, results
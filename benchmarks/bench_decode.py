@@ -0,0 +1,94 @@
+"""대용량 이미지 디코딩 벤치마크: 원본 해상도 디코딩 vs 디코딩 시 축소(ingest).
+
+12~48MP JPEG(EXIF 회전 포함), PNG, 멀티 페이지 TIFF를 합성해 각 방식의 디코딩 시간과
+최대 메모리 증가량(별도 프로세스의 ru_maxrss)을 비교. fastai/torch 불필요.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_decode --target 224 --repeat 3
+"""
+import argparse
+import multiprocessing as mp
+import resource
+import sys
+import time
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from ingest import ingest, load_pil_from_bytes
+
+CASES = {  # 이름: (가로, 세로, 포맷)
+    "jpeg-12mp": (4000, 3000, "JPEG"),
+    "jpeg-24mp-rot": (6000, 4000, "JPEG"),
+    "jpeg-48mp": (8000, 6000, "JPEG"),
+    "png-12mp": (4000, 3000, "PNG"),
+    "tiff-12mp-x3": (4000, 3000, "TIFF"),
+}
+
+
+def make_image(w: int, h: int, fmt: str, rotate: bool = False) -> bytes:
+    rng = np.random.default_rng(0)
+    small = Image.fromarray(rng.integers(0, 256, (h // 100, w // 100, 3), dtype=np.uint8))
+    im = small.resize((w, h), Image.Resampling.BICUBIC)
+    buf = BytesIO()
+    if fmt == "TIFF":
+        im.save(buf, "TIFF", save_all=True, append_images=[im, im])
+    elif rotate:
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        im.save(buf, fmt, quality=90, exif=exif)
+    else:
+        im.save(buf, fmt, **({"quality": 90} if fmt == "JPEG" else {}))
+    return buf.getvalue()
+
+
+def baseline(b: bytes, target) -> None:
+    # 기존 경로: 원본 디코딩 → numpy 왕복 (PILImage.create(np.array(pil)) 과 같은 복사)
+    Image.fromarray(np.array(load_pil_from_bytes(b)))
+
+
+def downscaled(b: bytes, target) -> None:
+    ingest(b, target)
+
+
+def _child(fn_name: str, b: bytes, target, repeat: int, out) -> None:
+    fn = {"baseline": baseline, "ingest": downscaled}[fn_name]
+    rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(b, target)
+        times.append((time.perf_counter() - t0) * 1000)
+    rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    out.put((min(times), (rss1 - rss0) / 1024))  # Linux ru_maxrss 단위는 KB
+
+
+def measure(fn_name: str, b: bytes, target, repeat: int):
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    p = ctx.Process(target=_child, args=(fn_name, b, target, repeat, q))
+    p.start()
+    res = q.get()
+    p.join()
+    return res
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--target", type=int, default=224, help="모델 입력 크기 (정사각형)")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+    target = (args.target, args.target)
+
+    print(f"{'case':15s} {'MB':>6s} | {'baseline ms':>11s} {'peak MB':>8s} | {'ingest ms':>9s} {'peak MB':>8s}")
+    for name, (w, h, fmt) in CASES.items():
+        b = make_image(w, h, fmt, rotate=name.endswith("-rot"))
+        t0, m0 = measure("baseline", b, target, args.repeat)
+        t1, m1 = measure("ingest", b, target, args.repeat)
+        print(f"{name:15s} {len(b) / 1e6:6.1f} | {t0:11.1f} {m0:8.1f} | {t1:9.1f} {m1:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""learner.predict vs InferenceEngine: 결과 일치 확인 + 지연 시간 마이크로벤치마크.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_inference --model model.pkl --n 50
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+from fastai.vision.all import PILImage, load_learner
+
+from inference import InferenceEngine, check_parity
+
+
+def synthetic_images(n: int, size=(640, 480), seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    return [Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)) for _ in range(n)]
+
+
+def time_ms(fn, imgs) -> list:
+    out = []
+    for im in imgs:
+        t0 = time.perf_counter()
+        fn(im)
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--n", type=int, default=50, help="측정 반복 횟수")
+    ap.add_argument("--warmup", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    learner = load_learner(args.model, cpu=True)
+    engine = InferenceEngine(learner)
+    imgs = synthetic_images(args.n + args.warmup)
+
+    mismatches = check_parity(learner, engine, imgs[:10])
+    for line in mismatches:
+        print(f"[불일치] {line}")
+    if mismatches:
+        print("패리티 실패: InferenceEngine 결과가 learner.predict와 다릅니다.")
+        return 1
+    print("패리티 OK (pred, pred_idx, probs 완전 일치)")
+
+    warm, run = imgs[:args.warmup], imgs[args.warmup:]
+    time_ms(lambda im: learner.predict(PILImage.create(np.array(im))), warm)
+    time_ms(engine.predict, warm)
+    base = time_ms(lambda im: learner.predict(PILImage.create(np.array(im))), run)
+    fast = time_ms(engine.predict, run)
+
+    for name, xs in (("learner.predict", base), ("InferenceEngine", fast)):
+        print(f"{name:16s} mean {statistics.mean(xs):7.2f} ms  p50 {statistics.median(xs):7.2f} ms  "
+              f"min {min(xs):7.2f} ms")
+    print(f"속도 향상: x{statistics.median(base) / statistics.median(fast):.2f} (p50 기준)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""요청 파이프라인 오프라인 벤치마크 (Streamlit 없이): 디코딩 → 추론 → 확률 패널 HTML.
+
+여러 크기의 합성 JPEG에 대해 단계별 지연 백분위수와 처리량을 출력하고,
+저장된 기준(baseline)보다 허용치 이상 느려지면 종료 코드 1로 실패.
+기본 크기에는 축소 없이 그대로 디코딩되는 작은 이미지(200x150)도 포함.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.bench_pipeline --model model.pkl --save-baseline bench_baseline.json
+    python -m benchmarks.bench_pipeline --model model.pkl --baseline bench_baseline.json --tolerance 0.15
+"""
+import argparse
+import json
+import sys
+import time
+
+from fastai.vision.all import load_learner
+
+from benchmarks.bench_decode import make_image
+from inference import InferenceEngine
+from ingest import ingest, target_size_from_learner
+from metrics import Metrics
+from render import prob_panel_html, top_k
+
+STAGES = ("decode", "predict", "probabilities", "total")
+TOP_K = 5
+
+
+def run_once(engine: InferenceEngine, labels: list, b: bytes, target, metrics: Metrics) -> None:
+    t0 = time.perf_counter()
+    with metrics.timer("decode"):
+        pil, _ = ingest(b, target)
+    with metrics.timer("predict"):
+        _, _, probs = engine.predict(pil)
+    with metrics.timer("probabilities"):
+        prob_panel_html([(labels[i], p) for i, p in top_k(probs, TOP_K)])
+    metrics.observe("total", (time.perf_counter() - t0) * 1000)
+
+
+def run(engine: InferenceEngine, sizes: list, n: int, warmup: int, target) -> dict:
+    labels = [str(x) for x in engine.vocab]
+    results = {}
+    for w, h in sizes:
+        b = make_image(w, h, "JPEG")
+        for _ in range(warmup):
+            run_once(engine, labels, b, target, Metrics())
+        metrics = Metrics(window=n)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            run_once(engine, labels, b, target, metrics)
+        wall = time.perf_counter() - t0
+        snap = metrics.snapshot()
+        results[f"{w}x{h}"] = {
+            **{s: {"p50_ms": snap[s]["p50_ms"], "p95_ms": snap[s]["p95_ms"]} for s in STAGES},
+            "throughput": n / wall,
+        }
+    return results
+
+
+def regressions(current: dict, baseline: dict, tolerance: float) -> list:
+    """total p50/p95가 baseline × (1 + tolerance)를 넘거나 처리량이 그만큼 떨어진 항목."""
+    out = []
+    for size, base in baseline.items():
+        cur = current.get(size)
+        if cur is None: continue
+        for q in ("p50_ms", "p95_ms"):
+            if cur["total"][q] > base["total"][q] * (1 + tolerance):
+                out.append(f"{size} total {q}: {cur['total'][q]:.1f} > 기준 {base['total'][q]:.1f}")
+        if cur["throughput"] < base["throughput"] / (1 + tolerance):
+            out.append(f"{size} throughput: {cur['throughput']:.2f} < 기준 {base['throughput']:.2f}")
+    return out
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--sizes", default="200x150,640x480,1920x1080,4000x3000")
+    ap.add_argument("--n", type=int, default=20, help="크기별 측정 횟수")
+    ap.add_argument("--warmup", type=int, default=2)
+    ap.add_argument("--full-decode", action="store_true", help="디코딩 시 축소 없이 원본 해상도로")
+    ap.add_argument("--baseline", help="비교할 기준 JSON")
+    ap.add_argument("--save-baseline", help="이번 결과를 기준 JSON으로 저장")
+    ap.add_argument("--tolerance", type=float, default=0.15, help="허용 성능 저하 비율")
+    args = ap.parse_args(argv)
+
+    learner = load_learner(args.model, cpu=True)
+    engine = InferenceEngine(learner)
+    target = None if args.full_decode else target_size_from_learner(learner)
+    sizes = [tuple(int(v) for v in s.split("x")) for s in args.sizes.split(",")]
+    results = run(engine, sizes, args.n, args.warmup, target)
+
+    print(f"{'size':>10s} " + " ".join(f"{s + ' p50/p95':>22s}" for s in STAGES) + f" {'img/s':>7s}")
+    for size, r in results.items():
+        cols = " ".join(f"{r[s]['p50_ms']:10.1f}/{r[s]['p95_ms']:<11.1f}" for s in STAGES)
+        print(f"{size:>10s} {cols} {r['throughput']:7.2f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            bad = regressions(results, json.load(fh), args.tolerance)
+        for line in bad:
+            print(f"[회귀] {line}")
+        if bad: return 1
+        print(f"기준 대비 회귀 없음 (허용치 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""동시 접속 부하 테스트: 호출별 추론(engine.predict) vs 마이크로 배칭 InferenceService.
+
+N개의 클라이언트 스레드가 각각 M번 요청을 보내고 p50/p95 지연과 처리량을 비교.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.load_test --model model.pkl --clients 8 --requests 20
+"""
+import argparse
+import sys
+import threading
+import time
+
+import numpy as np
+from fastai.vision.all import load_learner
+
+from benchmarks.bench_inference import synthetic_images
+from inference import InferenceEngine
+from inference_service import InferenceService, QueueFullError
+
+
+def run_clients(call, imgs, clients: int, requests: int) -> dict:
+    latencies, rejected = [], 0
+    lock = threading.Lock()
+    start = threading.Barrier(clients + 1)
+
+    def client(k: int) -> None:
+        nonlocal rejected
+        start.wait()
+        for j in range(requests):
+            t0 = time.perf_counter()
+            try:
+                call(imgs[(k * requests + j) % len(imgs)])
+            except QueueFullError:
+                with lock: rejected += 1
+                continue
+            with lock: latencies.append((time.perf_counter() - t0) * 1000)
+
+    threads = [threading.Thread(target=client, args=(k,)) for k in range(clients)]
+    for t in threads: t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in threads: t.join()
+    wall = time.perf_counter() - t0
+    xs = np.asarray(latencies)
+    return {
+        "ok": len(xs),
+        "rejected": rejected,
+        "p50": float(np.percentile(xs, 50)) if len(xs) else float("nan"),
+        "p95": float(np.percentile(xs, 95)) if len(xs) else float("nan"),
+        "throughput": len(xs) / wall,
+    }
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--clients", type=int, default=8)
+    ap.add_argument("--requests", type=int, default=20, help="클라이언트당 요청 수")
+    ap.add_argument("--max-batch", type=int, default=8)
+    ap.add_argument("--max-wait-ms", type=float, default=10.0)
+    ap.add_argument("--max-queue", type=int, default=64)
+    args = ap.parse_args(argv)
+
+    engine = InferenceEngine(load_learner(args.model, cpu=True))
+    imgs = synthetic_images(32)
+    engine.predict(imgs[0])  # 워밍업
+
+    service = InferenceService(engine, max_batch_size=args.max_batch,
+                               max_wait_ms=args.max_wait_ms, max_queue=args.max_queue)
+    engine_lock = threading.Lock()  # InferenceEngine은 스레드 안전하지 않으므로 비교 기준은 한 번에 하나씩
+
+    def per_call(im):
+        with engine_lock:
+            return engine.predict(im)
+
+    try:
+        results = {
+            "per-call": run_clients(per_call, imgs, args.clients, args.requests),
+            "service": run_clients(lambda im: service.predict(im, timeout=60), imgs, args.clients, args.requests),
+        }
+        print(f"클라이언트 {args.clients} × 요청 {args.requests}, 평균 배치 {service.stats()['avg_batch_size']:.2f}")
+    finally:
+        service.close()
+
+    for name, r in results.items():
+        print(f"{name:9s} p50 {r['p50']:8.2f} ms  p95 {r['p95']:8.2f} ms  "
+              f"{r['throughput']:7.2f} req/s  ok {r['ok']}  rejected {r['rejected']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# content_store.py
+import base64
+import hashlib
+import json
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+from PIL import Image, ImageOps
+
+# ======================
+# 라벨별 콘텐츠 저장소 (manifest + 디스크 썸네일)
+# ======================
+def pick_top3(lst):
+    return [x for x in lst if isinstance(x, str) and x.strip()][:3]
+
+class ContentStore:
+    """manifest.json에 적힌 라벨별 텍스트/이미지/동영상을 가벼운 참조로 제공.
+
+    로컬 이미지(상대 경로, data: URI)는 내용 해시로 이름 붙인 썸네일을 한 번만 만들어
+    static 폴더에 저장하고 URL만 돌려줌. 원격 URL은 그대로 통과. 라벨별로 처음 요청될 때 준비.
+    """
+
+    def __init__(self, manifest_path, static_dir, static_url: str, thumb_size: tuple[int, int] = (480, 480)):
+        manifest_path = Path(manifest_path)
+        self.root = manifest_path.parent
+        self.static_dir = Path(static_dir)
+        self.static_url = static_url.rstrip("/")
+        self.thumb_size = thumb_size
+        self._entries = json.loads(manifest_path.read_text(encoding="utf-8")).get("labels", []) \
+            if manifest_path.exists() else []
+        self._resolved: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, label: str, index: int | None) -> dict:
+        for e in self._entries:
+            if e.get("label") == label: return e
+        for e in self._entries:
+            if index is not None and e.get("index") == index: return e
+        return {}
+
+    def get(self, label: str, index: int | None = None):
+        """(texts, image_urls, videos). 없으면 빈 리스트."""
+        with self._lock:
+            if label in self._resolved: return self._resolved[label]
+        e = self._entry(label, index)
+        images = [u for u in map(self._image_ref, pick_top3(e.get("images", []))) if u]
+        res = (pick_top3(e.get("texts", [])), images, pick_top3(e.get("videos", [])))
+        with self._lock:
+            self._resolved[label] = res
+        return res
+
+    def _read_source(self, src: str) -> bytes:
+        if src.startswith("data:"): return base64.b64decode(src.split(",", 1)[1])
+        return (self.root / src).read_bytes()
+
+    def _image_ref(self, src: str) -> str | None:
+        if src.startswith(("http://", "https://")): return src
+        try:
+            data = self._read_source(src)
+        except (OSError, ValueError):
+            return None
+        w, h = self.thumb_size
+        name = f"{hashlib.sha256(data).hexdigest()[:16]}_{w}x{h}.jpg"
+        path = self.static_dir / name
+        if not path.exists():
+            try:
+                self._write_thumbnail(data, path)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                return None
+        return f"{self.static_url}/{name}"
+
+    def _write_thumbnail(self, data: bytes, path: Path) -> None:
+        im = ImageOps.exif_transpose(Image.open(BytesIO(data)))
+        if im.mode != "RGB": im = im.convert("RGB")
+        im.thumbnail(self.thumb_size, Image.Resampling.LANCZOS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        im.save(tmp, "JPEG", quality=85, optimize=True)
+        os.replace(tmp, path)
@@ -0,0 +1,76 @@
+# inference.py
+from PIL import Image
+
+# torch/fastai는 무거우므로 실제로 쓰는 시점에 import (앱 첫 화면 렌더링을 막지 않도록)
+
+# ======================
+# 경량 추론 엔진
+# ======================
+class InferenceEngine:
+    """learner의 전처리 파이프라인을 로드 시 한 번만 꺼내 두고, `learner.model`을 직접 호출.
+
+    `learner.predict`처럼 매번 test DataLoader를 만들거나 콜백을 돌리지 않지만,
+    같은 after_item/after_batch 변환과 손실 함수의 activation/decodes를 써서 결과는 동일.
+    변환 객체가 호출마다 상태를 바꾸므로 스레드 안전하지 않음. 여러 스레드에서는 `InferenceService`를 통해 사용.
+    """
+
+    def __init__(self, learner, model=None):
+        from fastcore.basics import noop
+        self.learner = learner
+        # model: 내보낸 백엔드(TorchScript/ONNX 등). 없으면 learner의 eager 모델
+        self.model = model if model is not None else learner.model.eval()
+        dl = learner.dls.valid
+        # load_learner 직후 파이프라인은 split_idx=None이라 Resize/RandomResizedCrop이 학습용(무작위) 크롭을 함.
+        # learner.predict(test_dl)처럼 검증 split(1)으로 고정
+        # (Pipeline 클래스는 fastai 버전에 따라 fastcore/fasttransform에 있으므로 기존 객체의 타입을 그대로 씀)
+        self.after_item = type(dl.after_item)(dl.after_item.fs, split_idx=1)
+        self.after_batch = type(dl.after_batch)(dl.after_batch.fs, split_idx=1)
+        self.device = learner.dls.device
+        self.vocab = learner.dls.vocab
+        self.activation = getattr(learner.loss_func, "activation", noop)
+        self.decodes = getattr(learner.loss_func, "decodes", noop)
+
+    def preprocess(self, pil: Image.Image):
+        """PIL 이미지 → 배치 전 단일 텐서 (Resize, ToTensor 등 item 변환)."""
+        from fastai.vision.core import PILImage
+        return self.after_item(PILImage.create(pil))
+
+    def collate(self, items: list):
+        """item 텐서들을 쌓아 batch 변환(IntToFloatTensor, Normalize 등)까지 적용."""
+        import torch
+        from fastai.torch_core import TensorImage
+        xb = TensorImage(torch.stack(items)).to(self.device)
+        return self.after_batch(xb)
+
+    def forward(self, xb):
+        """전처리된 배치 → (probs, pred_idxs)."""
+        import torch
+        with torch.inference_mode():
+            probs = self.activation(self.model(xb)).cpu()
+            return probs, self.decodes(probs)
+
+    def predict_batch(self, pils: list) -> list:
+        """여러 이미지를 한 번의 forward로 예측. 각 원소는 (pred, pred_idx, probs)."""
+        if not pils: return []
+        probs, idxs = self.forward(self.collate([self.preprocess(p) for p in pils]))
+        return [(self.vocab[int(i)], i, p) for i, p in zip(idxs, probs)]
+
+    def predict(self, pil: Image.Image):
+        """`learner.predict`와 같은 (pred, pred_idx, probs) 반환."""
+        return self.predict_batch([pil])[0]
+
+def check_parity(learner, engine: InferenceEngine, images: list) -> list[str]:
+    """engine 결과가 `learner.predict`와 완전히 같은지 확인. 불일치 항목 설명 목록 반환(비어 있으면 통과).
+
+    같은 변환 객체를 쓰므로 다른 스레드가 learner/engine을 쓰기 전에 호출할 것.
+    """
+    import numpy as np
+    from fastai.vision.core import PILImage
+    errors = []
+    for k, im in enumerate(images):
+        p0, i0, pr0 = learner.predict(PILImage.create(np.array(im)))  # 기존 앱 경로 그대로
+        p1, i1, pr1 = engine.predict(im)
+        diff = float((pr0 - pr1).abs().max())
+        if str(p0) != str(p1) or int(i0) != int(i1) or diff != 0.0:
+            errors.append(f"#{k} {im.size}: learner=({p0}, {int(i0)}) engine=({p1}, {int(i1)}) max|Δp|={diff:.3g}")
+    return errors
@@ -0,0 +1,137 @@
+# inference_service.py
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from PIL import Image
+
+# ======================
+# 프로세스 공용 마이크로 배칭 추론 서비스
+# ======================
+class QueueFullError(RuntimeError):
+    """대기열이 가득 차 요청을 받지 않음."""
+
+class InferenceService:
+    """여러 세션의 요청을 짧은 시간 창 안에서 모아 한 번의 batched forward로 처리.
+
+    전처리와 forward 모두 백그라운드 워커 하나에서 실행(FIFO). fastai 변환 객체(RandTransform 등)는
+    호출마다 내부 상태를 바꾸므로 여러 세션 스레드에서 동시에 돌리면 안 됨. 따라서 앱에서 learner를
+    쓰는 추론(단일/일괄)은 모두 이 서비스를 거쳐야 함 (예외: 시작 시 워밍업은 learner를 내주기 전에 끝남).
+    대기열이 `max_queue`를 넘으면 쌓아 두지 않고 `QueueFullError`로 거절.
+    """
+
+    def __init__(self, engine, max_batch_size: int = 8, max_wait_ms: float = 10.0, max_queue: int = 64):
+        self.engine = engine
+        self.vocab = engine.vocab
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._q: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.submitted = self.rejected = self.batches = self.batched_items = 0
+        self._thread = threading.Thread(target=self._run, name="inference-service", daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, pils: list, single: bool) -> Future:
+        if self._stop.is_set(): raise RuntimeError("InferenceService가 종료되었습니다.")
+        fut: Future = Future()
+        try:
+            self._q.put_nowait((pils, fut, single))
+        except queue.Full:
+            with self._lock: self.rejected += 1
+            raise QueueFullError(f"추론 대기열이 가득 찼습니다 (최대 {self._q.maxsize}건).") from None
+        with self._lock: self.submitted += 1
+        return fut
+
+    def submit(self, pil: Image.Image) -> Future:
+        """요청을 대기열에 넣고 (pred, pred_idx, probs)를 돌려줄 Future 반환."""
+        return self._enqueue([pil], single=True)
+
+    def submit_batch(self, pils: list) -> Future:
+        """이미지 여러 장을 한 요청으로 넣고 [(pred, pred_idx, probs), ...]를 돌려줄 Future 반환."""
+        if not pils:
+            fut: Future = Future()
+            fut.set_result([])
+            return fut
+        return self._enqueue(list(pils), single=False)
+
+    @staticmethod
+    def _wait(fut: Future, timeout: float | None):
+        try:
+            return fut.result(timeout)
+        except FutureTimeoutError:
+            fut.cancel()  # 아직 워커가 집어 가지 않았다면 대기열에서 버려짐
+            raise
+
+    def predict(self, pil: Image.Image, timeout: float | None = None):
+        """`InferenceEngine.predict`와 같은 결과. 시간 초과 시 `concurrent.futures.TimeoutError`."""
+        return self._wait(self.submit(pil), timeout)
+
+    def predict_batch(self, pils: list, timeout: float | None = None) -> list:
+        """`InferenceEngine.predict_batch`와 같은 결과. 시간 초과 시 `concurrent.futures.TimeoutError`."""
+        if not pils: return []
+        return self._wait(self.submit_batch(pils), timeout)
+
+    def _next_batch(self) -> list:
+        """대기열에서 이미지 합계가 `max_batch_size`가 될 때까지(또는 `max_wait` 동안) 요청을 모음."""
+        try:
+            batch = [self._q.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        n = len(batch[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while n < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: break
+            try:
+                batch.append(self._q.get(timeout=remaining))
+            except queue.Empty:
+                break
+            n += len(batch[-1][0])
+        return [job for job in batch if job[1].set_running_or_notify_cancel()]
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            jobs, items = [], []
+            for pils, f, single in self._next_batch():
+                try:
+                    xs = [self.engine.preprocess(p) for p in pils]
+                except Exception as e:  # 전처리 실패는 해당 요청만 실패시킴
+                    f.set_exception(e)
+                    continue
+                jobs.append((len(xs), f, single))
+                items += xs
+            if not jobs: continue
+            try:
+                probs, idxs = self.engine.forward(self.engine.collate(items))
+            except Exception as e:  # 워커는 죽지 않고, 해당 배치의 요청자에게 예외 전달
+                for _, f, _ in jobs: f.set_exception(e)
+                continue
+            with self._lock:
+                self.batches += 1
+                self.batched_items += len(items)
+            results = [(self.vocab[int(i)], i, p) for i, p in zip(idxs, probs)]
+            start = 0
+            for n, f, single in jobs:
+                f.set_result(results[start] if single else results[start:start + n])
+                start += n
+
+    def close(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        self._thread.join(timeout)
+        while True:
+            try:
+                _, f, _ = self._q.get_nowait()
+            except queue.Empty:
+                break
+            f.cancel()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self._q.qsize(),
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "batches": self.batches,
+                "avg_batch_size": self.batched_items / self.batches if self.batches else 0.0,
+            }
@@ -0,0 +1,78 @@
+# ingest.py
+import math
+from io import BytesIO
+from PIL import Image, ImageOps
+
+# EXIF Orientation → 변환 (ImageOps.exif_transpose와 동일한 매핑)
+_ORIENTATION = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+THUMB_SIZE = (640, 640)
+
+# ======================
+# 이미지 수집(디코딩) 단계
+# ======================
+def load_pil_from_bytes(b: bytes) -> Image.Image:
+    """원본 해상도 그대로 디코딩 (EXIF 회전 + RGB)."""
+    pil = Image.open(BytesIO(b))
+    pil = ImageOps.exif_transpose(pil)
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    return pil
+
+def target_size_from_learner(learner, default=(224, 224)) -> tuple[int, int]:
+    """learner의 item 변환(Resize 등)에서 모델 입력 크기 (w, h)를 읽음."""
+    for t in learner.dls.valid.after_item.fs:
+        size = getattr(t, "size", None)
+        if size is None: continue
+        if isinstance(size, int): return size, size
+        return int(size[0]), int(size[1])  # fastai는 (w, h) 순서로 저장
+    return default
+
+def decode_for_model(b: bytes, target: tuple[int, int] | None, margin: float = 2.0) -> Image.Image:
+    """모델 입력 크기 근처로 줄여서 디코딩.
+
+    JPEG은 draft 모드(DCT 1/2~1/8 축소)로, 그 외 포맷은 `reduce`로 줄인 뒤 EXIF 회전과
+    RGB 변환을 작은 크기에서 적용. 짧은 변 기준으로 target×margin 이상은 남겨 두므로
+    이후 fastai Resize 결과는 원본 디코딩과 거의 같음. target이 None이면 원본 해상도.
+    멀티 페이지 TIFF는 첫 페이지만 사용.
+    """
+    if target is None: return load_pil_from_bytes(b)
+    pil = Image.open(BytesIO(b))
+    transpose = _ORIENTATION.get(pil.getexif().get(0x0112, 1))
+    tw, th = target
+    if transpose in (Image.Transpose.TRANSPOSE, Image.Transpose.TRANSVERSE,
+                     Image.Transpose.ROTATE_90, Image.Transpose.ROTATE_270):
+        tw, th = th, tw  # 회전 후 기준이므로 디코딩 단계에선 가로/세로를 바꿔서 계산
+    need_w, need_h = tw * margin, th * margin
+    scale = max(need_w / pil.width, need_h / pil.height)
+    if scale < 1:
+        if pil.format == "JPEG":
+            pil.draft("RGB", (math.ceil(pil.width * scale), math.ceil(pil.height * scale)))
+        factor = int(min(pil.width / need_w, pil.height / need_h))
+        if factor >= 2:
+            # reduce는 팔레트(P/PA), 1비트, 16비트(I;16 등) 모드를 지원하지 않으므로 먼저 변환
+            if pil.mode in ("1", "P", "PA") or pil.mode.startswith("I;"):
+                pil = pil.convert("L" if pil.mode == "1" else "RGB")
+            pil = pil.reduce(factor)
+    if transpose is not None: pil = pil.transpose(transpose)
+    if pil.mode != "RGB": pil = pil.convert("RGB")
+    pil.load()  # 축소/회전/변환이 하나도 없으면 아직 디코딩 전(lazy)이라 fastai 변환에서 실패하므로 여기서 디코딩
+    return pil
+
+def make_thumbnail(pil: Image.Image, size: tuple[int, int] = THUMB_SIZE) -> Image.Image:
+    """`st.image` 표시용 작은 썸네일 (원본은 건드리지 않음)."""
+    if pil.width <= size[0] and pil.height <= size[1]: return pil
+    thumb = pil.copy()
+    thumb.thumbnail(size, Image.Resampling.BILINEAR)
+    return thumb
+
+def ingest(b: bytes, target: tuple[int, int] | None, thumb_size: tuple[int, int] = THUMB_SIZE):
+    """바이트 → (모델 입력용 이미지, 표시용 썸네일)."""
+    pil = decode_for_model(b, target)
+    return pil, make_thumbnail(pil, thumb_size)
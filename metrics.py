@@ -0,0 +1,133 @@
+# metrics.py
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# ======================
+# 단계별 지연 시간 측정
+# ======================
+def percentile(sorted_xs: list, q: float) -> float:
+    """정렬된 리스트의 q(0~100) 백분위수 (선형 보간)."""
+    if not sorted_xs: return float("nan")
+    k = (len(sorted_xs) - 1) * q / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_xs) - 1)
+    return sorted_xs[lo] + (sorted_xs[hi] - sorted_xs[lo]) * (k - lo)
+
+class StageHistogram:
+    """최근 `window`개 표본(백분위수용) + 누적 버킷 카운트(Prometheus 히스토그램용)."""
+
+    def __init__(self, window: int = 512, buckets: tuple = BUCKETS_MS):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.samples.append(ms)
+        self.count += 1
+        self.sum += ms
+        for i, b in enumerate(self.buckets):
+            if ms <= b: self.bucket_counts[i] += 1
+
+    def summary(self) -> dict:
+        xs = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean_ms": self.sum / self.count if self.count else float("nan"),
+            "p50_ms": percentile(xs, 50),
+            "p95_ms": percentile(xs, 95),
+            "p99_ms": percentile(xs, 99),
+            "max_ms": xs[-1] if xs else float("nan"),
+        }
+
+class Metrics:
+    """요청 파이프라인 단계(decode, predict, render …)별 지연 시간을 프로세스 안에 모아 둠."""
+
+    def __init__(self, window: int = 512):
+        self.window = window
+        self._stages: dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    @contextmanager
+    def timer(self, stage: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - t0) * 1000)
+
+    def observe(self, stage: str, ms: float) -> None:
+        with self._lock:
+            h = self._stages.get(stage)
+            if h is None: h = self._stages[stage] = StageHistogram(self.window)
+            h.observe(ms)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {name: h.summary() for name, h in self._stages.items()}
+
+    def to_prometheus(self, name: str = "app_stage_latency_ms") -> str:
+        """Prometheus text exposition format (단계별 histogram)."""
+        lines = [f"# HELP {name} Request pipeline stage latency in milliseconds.", f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, h in sorted(self._stages.items()):
+                for b, c in zip(h.buckets, h.bucket_counts):
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{b}"}} {c}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum:.3f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, min_interval: float = 0.0) -> bool:
+        """`.prom`이면 Prometheus 텍스트로 덮어쓰기(원자적), 그 외에는 JSONL 한 줄 추가.
+
+        min_interval초 안에 다시 호출되면 건너뜀. 실제로 기록했으면 True.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_write < min_interval: return False
+            self._last_write = now
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if path.endswith(".prom"):
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                fh.write(self.to_prometheus())
+            os.replace(tmp, path)
+        else:
+            record = {"time": datetime.now(timezone.utc).isoformat(timespec="seconds"), "stages": self.snapshot()}
+            with open(path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record) + "\n")
+        return True
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """`GET /metrics`로 Prometheus 텍스트를 제공하는 HTTP 서버를 백그라운드 스레드로 시작."""
+        metrics = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
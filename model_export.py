@@ -0,0 +1,202 @@
+# model_export.py
+"""learner → TorchScript / ONNX (선택적으로 int8 양자화) 내보내기, 검증, 디스크 캐시.
+
+CLI (저장소 루트에서):
+    python model_export.py --model model.pkl --backend onnx-int8 [--calib-dir 이미지폴더]
+"""
+import argparse
+import copy
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import torch
+from PIL import Image
+
+from inference import InferenceEngine
+from startup import sha256_file
+
+# int8은 ONNX Runtime 양자화만 지원 (torch dynamic 양자화는 nn.Linear만 바꿔 CNN에선 분류 헤드뿐이라 효과가 없음)
+BACKENDS = ("eager", "torchscript", "onnx", "onnx-int8", "onnx-int8-static")
+ARTIFACTS = {
+    "torchscript": "model.ts",
+    "onnx": "model.onnx",
+    "onnx-int8": "model.int8.onnx",
+    "onnx-int8-static": "model.int8-static.onnx",
+}
+CALIB_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".tiff", ".tif")
+
+# ======================
+# 백엔드 래퍼 (InferenceEngine.model 자리에 들어감)
+# ======================
+class TorchScriptModel:
+    def __init__(self, path):
+        self.module = torch.jit.load(str(path), map_location="cpu").eval()
+
+    def __call__(self, xb):
+        return self.module(xb.as_subclass(torch.Tensor))
+
+class OnnxModel:
+    def __init__(self, path, threads: int | None = None):
+        import onnxruntime as ort
+        opts = ort.SessionOptions()
+        if threads: opts.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(str(path), opts, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, xb):
+        x = xb.detach().cpu().numpy().astype(np.float32, copy=False)
+        return torch.from_numpy(self.session.run(None, {self.input_name: x})[0])
+
+# ======================
+# 내보내기
+# ======================
+def export_dir_for(model_path, model_sha256: str) -> Path:
+    """내보낸 아티팩트 디렉터리. 모델 파일 sha256(앱에서는 `ModelStartup.sha256`)이 캐시 키."""
+    p = Path(model_path)
+    return p.parent / f"{p.name}.export" / model_sha256[:16]
+
+def _example_batch(engine: InferenceEngine) -> torch.Tensor:
+    return engine.collate([engine.preprocess(Image.new("RGB", (224, 224)))]).as_subclass(torch.Tensor)
+
+def _atomic_target(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.with_name(path.name + ".tmp")
+
+def export_torchscript(learner, path: Path) -> None:
+    model = copy.deepcopy(learner.model).eval().cpu()
+    example = _example_batch(InferenceEngine(learner))
+    with torch.no_grad():
+        traced = torch.jit.trace(model, example)
+    tmp = _atomic_target(path)
+    traced.save(str(tmp))
+    os.replace(tmp, path)
+
+def export_onnx(learner, path: Path) -> None:
+    """TorchScript 기반(legacy) exporter로 가중치까지 한 파일에 담아 내보냄.
+
+    torch 2.9+의 기본값(dynamo=True)은 onnxscript가 필요하고, 가중치를 `<파일>.data`로 따로 써서
+    임시 파일 이름이 그대로 참조로 남으며, 그 그래프는 ORT dynamic 양자화에서 실패함.
+    """
+    model = copy.deepcopy(learner.model).eval().cpu()
+    example = _example_batch(InferenceEngine(learner))
+    tmp = _atomic_target(path)
+    kwargs = {"dynamo": False} if "dynamo" in inspect.signature(torch.onnx.export).parameters else {}
+    with torch.no_grad():
+        torch.onnx.export(model, example, str(tmp), input_names=["input"], output_names=["logits"],
+                          dynamic_axes={"input": {0: "batch"}, "logits": {0: "batch"}}, opset_version=17, **kwargs)
+    if tmp.with_name(tmp.name + ".data").exists():  # 외부 데이터는 임시 이름을 가리키므로 rename하면 깨짐
+        raise RuntimeError(f"ONNX 내보내기가 가중치를 별도 파일로 썼습니다: {tmp}.data")
+    os.replace(tmp, path)
+
+def quantize_onnx(src: Path, dst: Path, calib_batches: list | None = None) -> None:
+    """calib_batches가 없으면 dynamic int8, 있으면 static int8 (QDQ) 양자화."""
+    from onnxruntime.quantization import CalibrationDataReader, QuantType, quantize_dynamic, quantize_static
+
+    tmp = _atomic_target(dst)
+    if calib_batches is None:
+        quantize_dynamic(str(src), str(tmp), weight_type=QuantType.QInt8)
+    else:
+        class _Reader(CalibrationDataReader):
+            def __init__(self, batches): self._it = iter({"input": b} for b in batches)
+            def get_next(self): return next(self._it, None)
+        quantize_static(str(src), str(tmp), _Reader(calib_batches),
+                        activation_type=QuantType.QInt8, weight_type=QuantType.QInt8)
+    os.replace(tmp, dst)
+
+def load_images(folder, limit: int = 64) -> list:
+    files = sorted(p for p in Path(folder).rglob("*") if p.suffix.lower() in CALIB_EXTS)[:limit]
+    return [Image.open(p).convert("RGB") for p in files]
+
+def synthetic_images(n: int = 16, seed: int = 0) -> list:
+    """검증용 합성 이미지 (노이즈 + 그라디언트). 실제 이미지 폴더가 없을 때만 사용."""
+    rng = np.random.default_rng(seed)
+    imgs = []
+    for k in range(n):
+        if k % 2:
+            arr = rng.integers(0, 256, (256, 256, 3), dtype=np.uint8)
+        else:
+            g = np.linspace(0, 255, 256, dtype=np.float32)
+            arr = np.stack([np.add.outer(g, g * (c + 1) / 3) % 256 for c in range(3)], -1).astype(np.uint8)
+        imgs.append(Image.fromarray(arr))
+    return imgs
+
+def export_backend(learner, model_path, model_sha256: str, backend: str, calib_images: list | None = None) -> Path:
+    """backend 아티팩트를 내보내고 경로 반환. 이미 디스크에 있으면 그대로 사용."""
+    out_dir = export_dir_for(model_path, model_sha256)
+    path = out_dir / ARTIFACTS[backend]
+    if path.exists(): return path
+    if backend.startswith("torchscript"):
+        export_torchscript(learner, path)
+        return path
+    fp32 = out_dir / ARTIFACTS["onnx"]
+    if not fp32.exists(): export_onnx(learner, fp32)
+    if backend == "onnx-int8":
+        quantize_onnx(fp32, path)
+    elif backend == "onnx-int8-static":
+        if not calib_images: raise ValueError("onnx-int8-static 양자화에는 보정(calibration) 이미지가 필요합니다.")
+        engine = InferenceEngine(learner)
+        batches = [engine.collate([engine.preprocess(im)]).as_subclass(torch.Tensor).numpy() for im in calib_images]
+        quantize_onnx(fp32, path, calib_batches=batches)
+    return path
+
+def load_backend_model(backend: str, path: Path, threads: int | None = None):
+    return TorchScriptModel(path) if backend.startswith("torchscript") else OnnxModel(path, threads=threads)
+
+# ======================
+# 검증
+# ======================
+def validate_backend(reference: InferenceEngine, candidate: InferenceEngine, images: list,
+                     batch_size: int = 8) -> dict:
+    """eager 대비 top-1 일치율과 최대 확률 차이."""
+    agree, drift = 0, 0.0
+    for i in range(0, len(images), batch_size):
+        chunk = images[i:i + batch_size]
+        for (_, i0, p0), (_, i1, p1) in zip(reference.predict_batch(chunk), candidate.predict_batch(chunk)):
+            agree += int(i0) == int(i1)
+            drift = max(drift, float((p0 - p1).abs().max()))
+    n = len(images)
+    return {"n": n, "top1_agreement": agree / n if n else 1.0, "max_prob_drift": drift}
+
+def prepare_backend(learner, model_path, backend: str, calib_dir: str | None = None,
+                    model_sha256: str | None = None, threads: int | None = None):
+    """backend를 (필요 시) 내보내고 검증해 (model, report) 반환. eager면 (None, None).
+
+    model_sha256: 이미 검증한 모델 파일 해시 (없으면 여기서 계산). threads: ONNX Runtime intra-op 스레드 수.
+    검증 리포트는 아티팩트 옆 JSON으로 저장되어 재시작 시 다시 계산하지 않음.
+    """
+    if backend == "eager": return None, None
+    if backend == "torchscript-int8":
+        raise ValueError("torchscript-int8은 제거되었습니다 (분류 헤드만 양자화됨). onnx-int8 또는 onnx-int8-static을 사용하세요.")
+    if backend not in ARTIFACTS: raise ValueError(f"알 수 없는 MODEL_BACKEND: {backend!r} (가능: {', '.join(BACKENDS)})")
+    images = load_images(calib_dir) if calib_dir else []
+    path = export_backend(learner, model_path, model_sha256 or sha256_file(model_path), backend, calib_images=images)
+    model = load_backend_model(backend, path, threads=threads)
+    report_path = path.with_name(path.name + ".json")
+    if report_path.exists():
+        report = json.loads(report_path.read_text())
+    else:
+        report = validate_backend(InferenceEngine(learner), InferenceEngine(learner, model=model),
+                                  images or synthetic_images())
+        report.update(backend=backend, artifact=str(path))
+        report_path.write_text(json.dumps(report, indent=2))
+    return model, report
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="learner를 TorchScript/ONNX로 내보내고 eager 모델과 비교 검증")
+    ap.add_argument("--model", default="model.pkl")
+    ap.add_argument("--backend", choices=BACKENDS[1:], default="onnx")
+    ap.add_argument("--calib-dir", default=None, help="보정/검증용 이미지 폴더")
+    ap.add_argument("--min-agreement", type=float, default=0.98)
+    args = ap.parse_args(argv)
+
+    from fastai.vision.all import load_learner
+    _, report = prepare_backend(load_learner(args.model, cpu=True), args.model, args.backend, args.calib_dir)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if report["top1_agreement"] >= args.min_agreement else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
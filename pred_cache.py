@@ -0,0 +1,73 @@
+# pred_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+# ======================
+# 예측 캐시 (세션 간 공유, LRU)
+# ======================
+def make_cache_key(img_bytes: bytes, model_id: str) -> str:
+    """이미지 바이트 다이제스트 + 모델 식별자로 캐시 키 생성."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(model_id.encode("utf-8"))
+    h.update(b"\0")
+    h.update(img_bytes)
+    return h.hexdigest()
+
+def _entry_nbytes(pil: Image.Image, result) -> int:
+    n = pil.width * pil.height * len(pil.getbands())
+    for x in result:
+        n += int(getattr(x, "nbytes", 0) or 0)
+    return n
+
+class PredictionCache:
+    """키 → (표시용 이미지, (pred, pred_idx, probs)). 개수/바이트 한도 초과 시 오래된 것부터 제거."""
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, tuple] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, key: str, pil: Image.Image, result) -> None:
+        size = _entry_nbytes(pil, result)
+        if size > self.max_bytes: return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None: self._nbytes -= old[2]
+            self._data[key] = (pil, tuple(result), size)
+            self._nbytes += size
+            while self._data and (len(self._data) > self.max_entries or self._nbytes > self.max_bytes):
+                _, (_, _, n) = self._data.popitem(last=False)
+                self._nbytes -= n
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -0,0 +1,73 @@
+# render.py
+import re
+from functools import lru_cache
+from html import escape
+import numpy as np
+
+# ======================
+# HTML 템플릿 (모듈 로드 시 한 번만 준비, 패널 하나 = st.markdown 한 번)
+# ======================
+# 한 줄로 이어 붙여야 markdown이 들여쓰기를 코드 블록으로 오인하지 않음
+PROB_CARD = (
+    '<div class="prob-card">'
+    '<div style="display:flex;justify-content:space-between;margin-bottom:6px;">'
+    '<strong>{label}</strong><span>{pct:.2f}%</span></div>'
+    '<div class="prob-bar-bg"><div class="prob-bar-fg{hi}" style="width:{pct:.4f}%;"></div></div>'
+    '</div>'
+)
+TEXT_CARD = '<div class="card" style="grid-column:span 12;"><h4>텍스트</h4><div>{text}</div></div>'
+IMAGE_CARD = '<div class="card" style="grid-column:span 4;"><h4>이미지</h4><img src="{url}" class="thumb" /></div>'
+VIDEO_CARD = (
+    '<div class="card" style="grid-column:span 6;"><h4>동영상</h4>'
+    '<a href="{url}" target="_blank" class="thumb-wrap"><img src="{thumb}" class="thumb"/><div class="play"></div></a>'
+    '<div class="helper">{url}</div></div>'
+)
+VIDEO_LINK_CARD = '<div class="card" style="grid-column:span 6;"><h4>동영상</h4><a href="{url}" target="_blank">{url}</a></div>'
+
+# ======================
+# 유틸
+# ======================
+def yt_id_from_url(url: str) -> str | None:
+    if not url: return None
+    pats = [r"(?:v=|/)([0-9A-Za-z_-]{11})(?:\?|&|/|$)", r"youtu\.be/([0-9A-Za-z_-]{11})"]
+    for p in pats:
+        m = re.search(p, url)
+        if m: return m.group(1)
+    return None
+
+def yt_thumb(url: str) -> str | None:
+    vid = yt_id_from_url(url)
+    return f"https://img.youtube.com/vi/{vid}/hqdefault.jpg" if vid else None
+
+def top_k(probs, k: int | None) -> list[tuple[int, float]]:
+    """확률 상위 k개 (index, p)를 내림차순으로. 전체 정렬 대신 argpartition(O(n)) 후 k개만 정렬."""
+    p = np.asarray(probs, dtype=np.float64).ravel()
+    if k is not None and k <= 0: return []
+    if k is None or k >= len(p):
+        idx = np.argsort(-p, kind="stable")
+    else:
+        idx = np.argpartition(-p, k - 1)[:k]
+        idx = idx[np.argsort(-p[idx], kind="stable")]
+    return [(int(i), float(p[i])) for i in idx]
+
+# ======================
+# 패널 렌더링
+# ======================
+def prob_panel_html(rows: list[tuple[str, float]], highlight: str | None = None) -> str:
+    """(라벨, 확률) 목록 → 확률 막대 카드들을 담은 HTML 조각 하나."""
+    return "".join(
+        PROB_CARD.format(label=escape(lbl), pct=p * 100, hi=" highlight" if lbl == highlight else "")
+        for lbl, p in rows
+    )
+
+@lru_cache(maxsize=256)
+def content_panel_html(texts: tuple, images: tuple, videos: tuple) -> str:
+    """라벨 콘텐츠(텍스트/이미지/동영상) 카드를 하나의 info-grid로 묶은 HTML 조각 (라벨별로 캐시)."""
+    cards = [TEXT_CARD.format(text=escape(t)) for t in texts]
+    cards += [IMAGE_CARD.format(url=escape(u, quote=True)) for u in images[:3]]
+    for v in videos[:3]:
+        thumb = yt_thumb(v)
+        url = escape(v, quote=True)
+        cards.append(VIDEO_CARD.format(url=url, thumb=escape(thumb, quote=True)) if thumb
+                     else VIDEO_LINK_CARD.format(url=url))
+    return '<div class="info-grid">' + "".join(cards) + "</div>"
@@ -0,0 +1,195 @@
+# startup.py
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# ======================
+# 모델 파일 캐시 (체크섬 검증 + 원자적 교체)
+# ======================
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def verify_model(path: str, expected_sha256: str | None = None) -> str | None:
+    """모델 파일이 다운로드 완료 기록(.sha256)과 일치하면 sha256, 아니면 None."""
+    meta_path = path + ".sha256"
+    if not (os.path.exists(path) and os.path.exists(meta_path)): return None
+    try:
+        with open(meta_path, encoding="utf-8") as fh:
+            meta = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if os.path.getsize(path) != meta.get("size"): return None
+    digest = sha256_file(path)
+    if digest != meta.get("sha256"): return None
+    if expected_sha256 and digest != expected_sha256.lower(): return None
+    return digest
+
+def record_model(path: str, digest: str, file_id: str) -> None:
+    """다운로드 완료 기록(.sha256)을 원자적으로 씀. 이 기록이 있어야 다음 시작 때 파일을 재사용."""
+    with open(path + ".sha256.tmp", "w", encoding="utf-8") as fh:
+        json.dump({"sha256": digest, "size": os.path.getsize(path), "file_id": file_id}, fh)
+    os.replace(path + ".sha256.tmp", path + ".sha256")
+
+def ensure_model(file_id: str, path: str, expected_sha256: str | None = None) -> tuple[str, bool]:
+    """모델 파일을 준비하고 (sha256, 새로 내려받았는지) 반환.
+
+    없거나 검증에 실패하면 `.part`로 내려받아 체크섬을 확인한 뒤 rename하므로,
+    중간에 끊긴 다운로드가 모델 파일로 재사용되지 않음. 새로 내려받은 파일은 아직 기록(.sha256)이
+    없으므로, 호출자가 로드에 성공한 뒤 `record_model`을 불러야 재사용됨 (기대 체크섬이 없을 때
+    Drive의 HTML 페이지 같은 잘못된 파일이 캐시되지 않도록).
+    """
+    digest = verify_model(path, expected_sha256)
+    if digest: return digest, False
+    import gdown
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".part"
+    if gdown.download(f"https://drive.google.com/uc?id={file_id}", tmp, quiet=False) is None or not os.path.exists(tmp):
+        raise RuntimeError(f"모델 다운로드 실패: {file_id}")
+    digest = sha256_file(tmp)
+    if expected_sha256 and digest != expected_sha256.lower():
+        os.remove(tmp)
+        raise RuntimeError(f"모델 체크섬 불일치: 기대 {expected_sha256}, 실제 {digest}")
+    if os.path.exists(path + ".sha256"): os.remove(path + ".sha256")  # 교체 전 기록 무효화
+    os.replace(tmp, path)
+    return digest, True
+
+# ======================
+# CPU 스레드 / 워밍업
+# ======================
+def cpu_threads() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def tune_threads(n: int | None = None) -> int:
+    """CPU 추론 스레드 수 설정. torch import 전에 호출해야 OpenMP/MKL 환경 변수도 적용됨."""
+    n = n or cpu_threads()
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, str(n))
+    import torch
+    torch.set_num_threads(n)
+    try:
+        torch.set_num_interop_threads(1)  # forward는 한 번에 하나(InferenceService)라 inter-op 병렬 불필요
+    except RuntimeError:
+        pass  # 이미 병렬 작업이 시작된 뒤에는 바꿀 수 없음
+    return n
+
+def warm_up(learner, n: int = 2) -> list[str]:
+    """합성 이미지로 추론을 몇 번 돌려 PyTorch 1회성 초기화 비용을 미리 치르고,
+    정사각형이 아닌 이미지로 InferenceEngine과 `learner.predict`의 일치 여부도 확인.
+    워밍업 입력은 앱과 같은 `decode_for_model` 경로로 디코딩함 (축소가 필요 없는 작은 이미지를
+    표시 단계 없이 바로 추론할 수 있는지도 함께 확인됨).
+    반환: 불일치 설명 목록 (비어 있으면 통과)."""
+    from io import BytesIO
+    import numpy as np
+    from PIL import Image
+    from inference import InferenceEngine, check_parity
+    from ingest import decode_for_model, target_size_from_learner
+    engine = InferenceEngine(learner)
+    target = target_size_from_learner(learner)
+    buf = BytesIO()
+    Image.new("RGB", target, (127, 127, 127)).save(buf, "JPEG")
+    for _ in range(n):
+        engine.predict(decode_for_model(buf.getvalue(), target))
+    rng = np.random.default_rng(0)
+    samples = [Image.fromarray(rng.integers(0, 256, (h, w, 3), dtype=np.uint8)) for w, h in ((320, 240), (240, 320))]
+    return check_parity(learner, engine, samples)
+
+# ======================
+# 백그라운드 시작 (단계별 시간 기록)
+# ======================
+class ModelStartup:
+    """모델 준비를 백그라운드 스레드에서 진행: 다운로드/검증 → torch/fastai import → 로드 → 워밍업.
+
+    워밍업(및 learner.predict 일치 확인)은 learner를 내주기 전에 끝냄. 변환 객체를 공유하므로
+    다른 스레드가 learner를 쓰기 시작한 뒤에는 돌리지 않음. 불일치가 있으면 `parity_errors`에 남음.
+    단계별 시간(초)은 `timings`에, 이벤트는 `log_path`(JSONL)에 기록되어 릴리스 간 비교 가능.
+    """
+
+    def __init__(self, file_id: str, model_path: str, expected_sha256: str | None = None,
+                 threads: int | None = None, warmup: bool = True, log_path: str | None = None,
+                 release: str = ""):
+        self.file_id = file_id
+        self.model_path = model_path
+        self.expected_sha256 = expected_sha256
+        self.threads = threads
+        self.warmup = warmup
+        self.log_path = log_path
+        self.release = release
+        self.sha256: str | None = None
+        self.parity_errors: list[str] = []
+        self.timings: dict[str, float] = {}
+        self._t0 = time.perf_counter()
+        self._future: Future = Future()
+        self._marked: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="model-startup", daemon=True)
+        self._thread.start()
+
+    @contextmanager
+    def _phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - t0
+
+    def _run(self) -> None:
+        try:
+            with self._phase("download_verify"):
+                self.sha256, downloaded = ensure_model(self.file_id, self.model_path, self.expected_sha256)
+            with self._phase("import_torch"):
+                self.threads = tune_threads(self.threads)
+            with self._phase("import_fastai"):
+                import fastai.vision.all  # noqa: F401  (피클 안의 fastai 객체 복원용)
+                from fastai.learner import load_learner
+            with self._phase("load_learner"):
+                try:
+                    learner = load_learner(self.model_path, cpu=True)
+                except Exception:
+                    if downloaded: os.remove(self.model_path)  # 다음 시작 때 다시 내려받도록
+                    raise
+                if downloaded: record_model(self.model_path, self.sha256, self.file_id)
+            if self.warmup:
+                with self._phase("warmup"):
+                    self.parity_errors = warm_up(learner)
+                if self.parity_errors: self._log({"event": "parity_failed", "errors": self.parity_errors})
+            self.mark("model_ready")
+            self._future.set_result(learner)
+        except Exception as e:
+            if not self._future.done(): self._future.set_exception(e)
+            self._log({"event": "failed", "error": str(e)})
+
+    def learner(self, timeout: float | None = None):
+        """로드된 learner (준비될 때까지 대기). 준비 중 오류가 났으면 그 예외를 다시 발생."""
+        return self._future.result(timeout)
+
+    def mark(self, event: str) -> None:
+        """시작 시점부터 event까지 걸린 시간을 (처음 한 번만) 기록. 예: first_prediction."""
+        with self._lock:
+            if event in self._marked: return
+            self._marked.add(event)
+        self.timings[event] = time.perf_counter() - self._t0
+        self._log({"event": event})
+
+    def _log(self, record: dict) -> None:
+        if not self.log_path: return
+        record = {"time": datetime.now(timezone.utc).isoformat(timespec="seconds"), "release": self.release,
+                  "model_sha256": self.sha256, "threads": self.threads, **record,
+                  "timings": {k: round(v, 4) for k, v in self.timings.items()}}
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass  # 기록 실패가 서비스 시작을 막지 않도록
@@ -1,11 +1,17 @@
 # streamlita_app.py
-import os, re
-from io import BytesIO
-import numpy as np
+import os, time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import pandas as pd
 import streamlit as st
-from PIL import Image, ImageOps
-from fastai.vision.all import *
-import gdown
+from pred_cache import PredictionCache, make_cache_key
+from inference import InferenceEngine
+from batch import expand_uploads, classify_in_batches
+from inference_service import InferenceService, QueueFullError
+from ingest import decode_for_model, ingest, target_size_from_learner
+from content_store import ContentStore
+from startup import ModelStartup
+from metrics import Metrics
+from render import content_panel_html, prob_panel_html, top_k
 
 # ======================
 # 페이지/스타일
@@ -41,82 +47,99 @@ if "img_bytes" not in st.session_state:
     st.session_state.img_bytes = None
 if "last_prediction" not in st.session_state:
     st.session_state.last_prediction = None
+if "batch_rows" not in st.session_state:
+    st.session_state.batch_rows = None
 
 # ======================
-# 모델 로드
+# 모델 로드 (백그라운드)
 # ======================
 FILE_ID = st.secrets.get("GDRIVE_FILE_ID", "1KKWukqjO-VpqttYGiM8bEhR9_8LOvtqF")
-MODEL_PATH = st.secrets.get("MODEL_PATH", "model.pkl")
+# 버전별 모델 캐시: MODEL_CACHE_DIR/MODEL_VERSION/model.pkl (MODEL_PATH로 직접 지정 가능)
+MODEL_VERSION = st.secrets.get("MODEL_VERSION", FILE_ID)
+MODEL_CACHE_DIR = st.secrets.get("MODEL_CACHE_DIR", "model_cache")
+MODEL_PATH = st.secrets.get("MODEL_PATH", os.path.join(MODEL_CACHE_DIR, MODEL_VERSION, "model.pkl"))
+# eager | torchscript | onnx | onnx-int8 | onnx-int8-static
+MODEL_BACKEND = st.secrets.get("MODEL_BACKEND", "eager")
 
 @st.cache_resource
-def load_model_from_drive(file_id: str, output_path: str):
-    if not os.path.exists(output_path):
-        url = f"https://drive.google.com/uc?id={file_id}"
-        gdown.download(url, output_path, quiet=False)
-    return load_learner(output_path, cpu=True)
+def get_model_startup(file_id: str, model_path: str, expected_sha256: str | None,
+                      threads: int | None) -> ModelStartup:
+    """프로세스당 한 번: 모델 다운로드/검증 → 로드 → 워밍업을 백그라운드에서 시작."""
+    return ModelStartup(file_id, model_path, expected_sha256=expected_sha256, threads=threads,
+                        log_path=os.path.join(MODEL_CACHE_DIR, "startup_times.jsonl"),
+                        release=st.secrets.get("APP_RELEASE", MODEL_VERSION))
 
-with st.spinner("🤖 모델 로드 중..."):
-    learner = load_model_from_drive(FILE_ID, MODEL_PATH)
-st.success("✅ 모델 로드 완료")
+@st.cache_resource
+def get_inference_engine(model_id: str, backend: str, _learner, model_sha256: str, threads: int | None):
+    """전처리 파이프라인을 한 번만 준비한 추론 엔진 (모델/백엔드별로 하나).
 
-labels = [str(x) for x in learner.dls.vocab]
-st.write(f"**분류 가능한 항목:** `{', '.join(labels)}`")
-st.markdown("---")
+    내보낸 백엔드가 준비되지 않거나 검증 기준에 못 미치면 eager로 되돌아감.
+    반환: (engine, 백엔드 리포트 또는 None)
+    """
+    if backend == "eager":
+        return InferenceEngine(_learner), None
+    from model_export import prepare_backend
+    try:
+        model, report = prepare_backend(_learner, MODEL_PATH, backend, calib_dir=st.secrets.get("CALIB_DIR"),
+                                        model_sha256=model_sha256, threads=threads)
+    except Exception as e:  # 내보내기/양자화 도구(onnx, onnxruntime 등)의 오류 종류가 다양하므로 어떤 실패든 eager로
+        return InferenceEngine(_learner), {"backend": backend, "error": f"{type(e).__name__}: {e}"}
+    if report["top1_agreement"] < float(st.secrets.get("BACKEND_MIN_AGREEMENT", 0.98)):
+        return InferenceEngine(_learner), {**report, "error": "검증 기준 미달"}
+    return InferenceEngine(_learner, model=model), report
+
+@st.cache_resource
+def get_inference_service(model_id: str, _engine: InferenceEngine, max_batch: int,
+                          max_wait_ms: float, max_queue: int) -> InferenceService:
+    """모든 세션이 공유하는 마이크로 배칭 추론 워커."""
+    return InferenceService(_engine, max_batch_size=max_batch, max_wait_ms=max_wait_ms, max_queue=max_queue)
+
+@st.cache_resource
+def get_prediction_cache(max_entries: int, max_mb: int) -> PredictionCache:
+    """모든 세션이 공유하는 예측 캐시."""
+    return PredictionCache(max_entries=max_entries, max_bytes=max_mb * 1024 * 1024)
+
+@st.cache_resource
+def get_metrics(port: int | None) -> Metrics:
+    """단계별 지연 시간 집계 (프로세스 공용). port가 있으면 /metrics HTTP 엔드포인트도 시작."""
+    m = Metrics()
+    if port: m.serve(port)
+    return m
+
+metrics = get_metrics(int(st.secrets.get("METRICS_PORT", 0)) or None)
+METRICS_FILE = st.secrets.get("METRICS_FILE")  # *.prom → Prometheus 텍스트, 그 외 → JSONL
+
+startup = get_model_startup(FILE_ID, MODEL_PATH, st.secrets.get("MODEL_SHA256"),
+                            int(st.secrets.get("TORCH_THREADS", 0)) or None)
+model_status = st.empty()  # 입력 화면을 먼저 그리고, 모델이 준비되면 이 자리에 상태/라벨 표시
 
 # ======================
-# 라벨 이름 매핑: 여기를 채우세요!
+# 라벨별 콘텐츠: content/manifest.json을 채우세요!
 # 각 라벨당 최대 3개씩 표시됩니다.
 # ======================
-CONTENT_BY_LABEL: dict[str, dict[str, list[str]]] = {
-    # 예)
-    # "짬뽕": {
-    #   "texts": ["짬뽕의 특징과 유래", "국물 맛 포인트", "지역별 스타일 차이"],
-    #   "images": ["https://.../jjampong1.jpg", "https://.../jjampong2.jpg"],
-    #   "videos": ["https://youtu.be/XXXXXXXXXXX"]
-    # },
-    labels[0] : {"texts" : ["중국식 냉면은 맛있어"], "images" : ["https://www.unileverfoodsolutions.co.kr/dam/global-ufs/mcos/south-korea/calcmenu/recipes/kr-recipes/chinese/header/%EC%A4%91%EA%B5%AD%EB%83%89%EB%A9%B4-chinese-cold-noodles-header-1260x709px.jpg"]},
-    labels[1] : {"texts" : ["짜장면은 맛있어"], "images" : ["data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUSExMWFRUXFx0XFxcYGRoXGBcYGRgYGRcXGB8YHSggGBolHhcYITEiJSkrLi4uFx8zODUtNygtLisBCgoKDg0OGxAQGzUlICUtLy0tLS0tLS8wLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIALcBFAMBIgACEQEDEQH/xAAcAAACAgMBAQAAAAAAAAAAAAAFBgMEAAIHAQj/xAA/EAACAQIEBAQDBgQGAQQDAAABAhEAAwQSITEFIkFRBhNhcTKBkRRCUqGxwQcj0fAzQ2Jy4fFTFZKishY0gv/EABkBAAMBAQEAAAAAAAAAAAAAAAIDBAEABf/EADERAAICAQMDAgQEBgMAAAAAAAECABEDEiExBBNBIlEyYXGBFEKhsVKRwdHh8AUj8f/aAAwDAQACEQMRAD8Ap4z+WpJbXtSFxziV+6cskL2nf3pvXDkyWMzQHimChpqJMmkz1+zr2Ji8uHarvC71+y2ZGjuOhq4lqpltU89SSIQ6NIy4HHWcUuS6oDev7d6E8X8HsktbMr2/vaqS2zOmlMnBePFeS7qu0/1rFzleIGTpdO67xN+wEaGQa8+xV0rHcKs3hmWNf70NK3EeG+U0TIph6l+bhYlxPtW8BLhAK9OGFEzYrXyKD8S3vKOyntIuCkWbq3PrXWOF8VS4oIauVvYrMPdu2zKMRWF73MlzYQeJ2u3ifWrNvEnvXJsL4purowJonY8Y96HXIzhInVLGIPer1q/61yyx4v8AWrg8WnvTFcRRxGdNOI9ar3sYB1rmz+LGPWqOJ8Q3W2Jou4JwwmPnEeLoupNIfH+Leecq7d6HNce4eY1Nbw9KZrj0x1zKq2oqfDXINbtYrxbdDG8Q1hGNyFAk0zcJ8KXPichR+dC/AZQXZaPSul01EFSbJkN7QM3hy0y5Wk1EvhHCj/LFH68plCJLsfMBnwthh/lr9BUD+G7H4R9KYXFV3FAwmhjF+74csnoK1fgiRAo44qFqUTDDGUrGFy2yk9KTeIeGrwZmWCCZp6NRk1mrxCDGc6tXblk5biFfXcUUsYtTsaaMRYRxDKDS1ivCjm8gstkVjzdQB1gd6Ib8Ti3vJxerKaLHhLDqADnY9yx1+lZR6WgaxOJJipFV8Uuat7aVKqV5Wue6FqDjhqjVKLXsPIqk9mmK0MSFRUttKmsWKkNma0vNqaWMQ6aKdO3StbmZjLGan8kCvXFcHMwKoNysqa1ILVWcLgrlwwlt3/2qTTDgvBWMf/Kyju5AowrNxBfKi8mLPkA6VaTAADanrBfw5ub3Lqj/AGif1o3hvAlkfG7t9BTOy5kb9XjHE5S2BHaomwI9K7ZZ8I4Rf8oH/cSau2uDYdfhsoP/AORWjpj7xJ6xfacNw/DvQn2Bq7b4U52Rvoa67xfiWGwqhnCjsABNUcH4wwrTP8sdCY1+m1F2lBotFnqCdws5wODXTtaf6GpE4Fe/8TfSujYzxlg7Y/xMx6BRNLfFP4h9Laqo6E61rIi7kzVzO3CwKnBr3/ib6VZThdwfcb6VNhPG15tcyn5VcbxNduusEJl3gSD70IdJp7ntA97hrjdT9DVK5hiN1P0NdL4TxVbnK4XN3jQ0UbDId0X6U0KCLEScpBoict4JcyvG1O2C4sy6biir8OtH/LX6Vq3D7X4KYNoljqNzazxhTuIq5bxaNswoW3C7fSRWv/pnZvrRWIFGGGuio3eRQr7JcG2vzrXPcXcGhZSeDOuT32edqjCuelepiD3q1avGvOP/ABbl9Xdb9I4ZwPEpmxcPSvU4dcO8CiqXalzjvVKdIByxMw5r8Slh+GgakzUHE8WlpgdJqxjeJpbBMiuceJeLea/K2xqg0g2m40OQ7zoKcYEbVlc9w3Gjl1NZSu7Gfh4kKKsIRWeVXgt15eme1YMkd6rEa7VbtYV7jBbas7dlEn/imzgv8Ob7w19xaX8I5n+fQU/HiZuIp8yJ8RiSXiivCfDeLxGqWmg/eblH511nhHhPC4fVLQZvxPzN+e1HAKpXpR+aR5P+Q/gE5xgP4aMYN+9H+m2P3NM3DvBeDs6i0GPd+Y/nTFWVQuJF4EifqMj8mR2bKqIVQB6CKkrygPH/ABIuEdA6yj6ZgdQfUdqMkDmKAJMOswAkmAKSuKePQrtbs280aZ2PL9BQXxp4u80G3aJFv7zd/SkCzjS7ZV3J2nU0h8p/LH48QPxToWO8dYjJHIhJ3A3+tBn8W4vVhdMdTpAoFxTE/wDlXKQdBM/LSqKXWuHURb2y9/WpC7ne5UMa+BPeK8dNwwGZ2O7Ez9KM8Awz5GDjQrOvX+lC8Mi2RFm3LfiY7d96sPhLlwS2Iyz0Gi+2lLGRhwPuYZQVvChwxyyi7dD19q8RX62lPyqLC2yphrkgba/tRPGvbRRq6MROp5T7DtSRkZjQh+mV0tWyIa3B9NKsYXh5mbb/ACahPDUu3L45/wCWevQH1NEuJ4i7bZfLi4CNdtDPWmrrUwWCmGbl82wCwyH+9acfDvFReSCeYUh4THO6hb68p01rQu+FK3LTSs6RqR6HuKrTLfqEmfHYozqzLWhWk2z4guyL2aUiGXtTDhOPWbkANBNOXKrSdsTLLxWtctTGImaqXsdaX4nArTQ8wRZm9ZnNB/EJfImItMSLZzMo2Zev9aKYS+t1FuIZVhIoQ29TSJsxU7r9KiexPwtB9alZa0IohkYTNIME8Qv4m0JFsuO66/lSti/GTklYIbsQQfoafgxGxqDG4OzeEXbSt6xqK53ZhsajcWhT6hc5li8bdu7sfah+YzlI1roeI8IrvZef9Lb/AFoJjeEFTDqQfX9jUhbIPinpYnxHYRZOCNZRk4Miso+4IztiBxbJIVQSx2AEk/Km/gfgJ7kPiDkX8C/Efc/dpx4H4fs4Ucgl+rn4j/QUWimJ0wG7TzsvVsdllPh3CrNhctpAo9Nz7nc1crCaQ/GHigZzYRttD6t/SnlgokgDMY+UteIfGFrDMEA8xgRmAMZR1+dCsH43VsMwbS8Fj0J7iuY48XWYPEE9T196E5RUNcRujOz8U8WWbVtHUhi+oE9OpqnifHuHS5kglcslxsP61yK4waJYF1G3QetS4YQCnmKQQSxOpE9KnPUVzKR00dON+LL1+5ltP5ds7AaMR3NB+KHMOZ8xHcz+tKbXFVgTmL7ADQaVLicW1tcxRBmOgzSf+qTkDOdoxKQSbE45kSFXMC0TO5FCOE2WF43WU5lkiJjN92r9jG3LogBFMkZTptWLir4gwNTtXBnUUB/MzAEY8/pCONw7si6ku5zPpIzTqfao8FgmJIadN9wKo4vjV63EFSQIgTp9KOcMtG6q5mZGcEpKkKxG8HrSc2XIF1ER2MKNrmgW2nKpbN0boO8aVddkW2DdKcv3lbV9JAjvS5hONPZzm5adSrZWJ1120ncVFb8QWnvAlRzEKdI30nSuxvkB3X+s10U+Y24/hS/ZEvElLkq0iI5yRl12ofj1F5ecNpyqpPwnvPY0y3sBcxNhrC2lcCNVMNCHTfRvrS4l7yV8s3XEHZ0gj0Opo8bBUDCKKkmpTsC5aR7KkEXYIDSSCOxG1WLeDxKpLJp3J/WP1qWw7gZlUPP4df7FEsEl+24d2JtXAVKnQEdVjqKLv2araYcVed4MxCwmZm03lXzZe8g7VpguIlQdQyEaMT16TVrxDxqxl8lB9nTqFtgFj60rYe7hbY5bjM2YGJ0idZFNyBfyQUJA9Qjrcxb2kDZGyOJMg+0+1aWcSfiAInaKm474hfDYmEYqj4ey1oCCo0OaVPQn9KA/Z7l+4GTErbe4fhAGUe46UpsIDCpiZrG4jDiuL34hnOUbQaq/alIzEsY3nUD3qjjuKYjAXfsuItq7nZsoyvOxB+Y+tEMNxtEJ8y0FDrB8vmEdZjb5iuYEfED+8YhDD0y1hfE2KUBEVbiDp3HaiXhbxOoutby5VYyVP3G6x6Uu8LwNovOGvMubYNDJrt6irfH+FXQy3nQKyiDct6h+xbsazHlsEg2RAy4r2AqdSBB1BmvCtJPh/jJ/lFQWnlaNZPtTql9S2UHm3I6iqsb6xdSVkK8zUitCKnIqNxRzJFEV69wMMtxQw9d60u3FG5AqG3iFecpmN4rrnUZXucAtsZW4VHYwYrKsGsrNK+0Z3X94frV3itmNK/jDjD2VVLRXO07nUD2puTIEWzEIpY0IM/iVxS6tpFssysW3Gmkda5qRqSST95nbVmPWmnG4246hHYOx+Inp6LS3iuBvf/zQhBMLl1I3jfavNfrMZOxl+LEVG81zwAU5jBqtb8RAQMhJmCfyMCob+AvW4y3VY9IkEekTQNcG73oz5WmWJ2Hc0Y0ZF9RhNakVGTGcSsXAAMhPUOuU/UVURlQRbPlESRmEhh2119jUPHMMloW/L/mNrP01PpWWbpIUtIIEEEzHQfKuxYlUWDtMfKeKkRtPeIdyeX8MDbv1olcss+SbQlDCkxGUTymNzPftXr4oW7TQYcjlEd/vN6UMTFqg/wARVjadT6+1MDNp2EmzGm+cIHhdwlcirA+JswIn1jao+L2mtsNPiUCV15h8QHYbVYw9zLaN4h8u4fbTuJ6du9R/+uBiRttJAkkdum/WlF3JO1xmIMeZXw/CXYZnzAH4UXSf956fOjC8Tui0mGOUBLmdDOo7qB/e9VGx9tzlcsq7GG/fpQ9+MYewT5KqGOhac7/+5qQTkJqv0ldDzGbHWLtx3vZJzQciRpoAYB1IO/zqNscuETN9nSGkEAqH1mQZHYVU4DxrEhw9pCyarm0TU9ZYVZx90Bx5mEQtvLPn+kiljUPj5+R/zOO/wyThnia3oUS9bBP3TofSQdRVnE4u28jzFDRJVxBOkgQ1EOHXi9uMqL1y5wCB002B9q3vWrZA822sAznaG/Pp86wZ/fb5XczR7RJHHihE2xbJPTkOvWIFM64w3EVb03QglSJBUHUx0NaYzH20OiYe4u0sRI9aAYnGLnLDFWLY2yBWYe4IOho2IaiNpoU+Y0X8JavDOptsyjZ0kx/u61BZwWbRUt/JQv6io/DHEzaChjbuoDpCwBoRuddZqxa4Tdt2FXzfMb8QMGSZAIJ1UaDvWDGSOR99oJNQN4n4rbWx/OtXAwORLkA5cv3SSJCkSRQXw+9t0L+eUedIyxHYyNaa145jLYKX7DZR15XRvYHWqg4ngsys+HRGB0Jt5ZnfbQ1zZ2VdOkivINzBjs3sRJuIYRsda+0C4xykZ1MQkQhcekATHeaq3vCxS21y1iBdYbqJUkdcp2YV5exfnXBkujys5bKnUHcHWdttKM3eMsz/AMtrSKqhFtkMdPxMTHMacuUVbHeacbL8IinwgoSUUNauTykZhzdjTnwLi2NtMAyNdVdwV6dYOxqDGcUu5US0EDQc7MCZ7QROkVXXFYg5R56AnSJIg9N9YPeKnZyDqxj9eIzSSKYx0NizcBxOEPl3hzNbIjmPXKfc6igfDeJXkulyxLkmT3PX/qqnC+IXiw8y0xjTNBka7qwGvcHr1rzi7FXa9bYySBkiM7fig6Ceo6VTgz94U2zD/bk74tB9xL1vjJblF91O2vet7eEx765+X8RMaUMw96WV8RaEMNlMEdjpv70x2mNxUtpcYo40RoRhB+Emeaekb05Ht9NwWWhYntjwzeYzeumOwpgwmCW0uVRQ7hHHLly8bL24jr+GNgaOMKooSdifMrkVlbkVlbcCV/FXGjh7Yy/HcbInppJb1gfnXHPEHiHmOWXcAlnbc6k6nr6Cuk+NTJstocrNofUDm/KK5ZjvDjAvc8xWnUAbj+tebnIfNWQ7e0t6cBUscwTxLxHiLTxyeZA6BoB9QYqTD8bxDgEXGnqAoA9Y0qinC7ymCo9zGtG8Pw25bWWGm/4Z7/KnFcIFKBNAcn1GVcXfvqA7v7TEn6VStXWuGWWA27RvrTFc4fYuAeYmVuhVz9DNbr4ctOoi/cSNoCsB1g+nrQDNjXZhX2msj+IMupbAB7jpuSOleWwAozaEwTGwHSB+1ScP4CLTlr10gA8vQRuGPYmKsfYjdMrbbJ93MSMw9CYJHr1pzstbnaCgN8bwfiLr3rpAOb7q+v8Af6CiOG4dbtwbwVtQfLHNJ6CBvH0q0bNrDozKqgjcSGj07kd6r4GwHuZ+cifMZjAVUHXTQKJnqTNIORsp9Ow/eGEC8zzxDiL+IJsC2yoPiVRDEDUFhVBMJbZLaGwMyvme5LeZcU6BeyKBrR0Ya5iW82RaQkxmJzXE21AOgJ1ra9g2y5RdUdCQpP0Gwrmz9sBROXGDAOJ4UpaPhG8E7Dux6D0q7gMRhLTEoBcYiDktho6aM4hZ70OxwyyheRmlteZz/qnWZ0irdnhkqoQ3Mu5HTmAJg6Z4BHbeiBJWydoVWYxYgEITbmwWGUDNbuMw7HIxZZ9aVcVYxSXCwt3XJGU5oOkzywdNOlM/DrRCiWB99NtACAd4rw8JRmF125EPw6ktucq6QBPU/nQY3xA0JzKx5MX0xF5dGBOuxUqewOuhopgcXfEeXyid2adI6idKLcORSPKuObanUwM0kbAzrG9VcT4dF3M1stb/AAAmQxGhDEd+mmlC2FH3WowZCNjKXE7Ni9cEoqtPMUy7ddIMHWdDXmLxuGsKPKs2jcJHNBZgB8UlpBEDeKXOK4V7Tw5ZWGjLpsJOhHaosPfRYdWMrqOu3eenStXEQRqNiZYPwjedOwPEE8gXcRbItkgaW/MDIVMZSBmttmAGbQc1U8elu2pvEXDYJ05xkXsGYcwPvQTwt4kKr5ZbMAeW2QVtqkGUJ+6B0+VMPhi7/Nvc4CXVIVMwIVmb8TCD3rsyXSJx/eBRW2MBW/E43tJyjqiz/wDJ96L/AP5DffD5gPOXLzIyW7hnrC5dR+dL3i7zbuLuXMPaZbYJQFF05dCdNG11kdxQzB8QxOGui4Edh98Rqf8AUI61o6dl3T95hdW2IgjH4+3ecFbduxBMhVKganQayB6dKL8Pt2yIGOcnTsVHvnq5ib+GvO1y5YTMdzlJzNO5g6EyNfQVHf4PYVlLWggfoUYzB0y5SZ1kRFUZBrH/AJ/WAp08/uZdt4LEgiblu6g2iFcdiY0P1owj2iMt1iHEQ5XKwH+lux96H4DwxbvKTbVrQVS0i41tRl3kNoCOxHStsBYsh/IuvczRyl8pB7bCG9qhyYyo1f0/0RyuG2uFsFfj4Mapb8JXU9tm3qfEX7wlryrctRzwM6qJ++pEgeoketIvHPDIs3MwV4Y8sEZTr907rI6HajXhDxKw/kvzESpn4su8Eex/KsPTAKMgNj5bEQde9eYy3uEWnAu2LnlqqBSubOqidGAbUJJ1AOkihfHUu4c272aClwZLimRmI039tjXvH/JXzrVtmtkNGU7nSZBG4MwR86ls4Y3uGAMGe8cpUAEkkFmXTqcoJ9qpCEZFJN3tF6vSYyWvEyg4ZMoa86EXGc5czhZWSOhJP0im6xeDqGBkH9RoR9ZrkfE7qPh7GJzCUZbbAaGVGm3UgR8qdPDHFlTC3L13lU3SwUamW1yKOpmqlc16oh8Y/LGg17Ss3iPEGGFqzaVhKi9cIcr0aBsDr9Kyt1iDoi543Ded5ktBAQCdBqMx+gpa4hh2NlbiNlnUg6iCeX1+nemT+JjhbWxJGsDQwInXp0pUXHi6kKSIA09REVxA0HaagYsKi+nF7xvJaVVd5hdwJPvoKccJhfMkXrpZh8SpoB3WaBYS+qXsy2lNy42gaMxJEQI+EdTR37E1tbgZwLlw6t2/2j9qjzn0jTsZUtg0xuQcRXDqAo8tTG5bmB6e1DkV1Ei7ybSdQT79ais8DUg6G4JgudCT1CnoO5qPiGCKfEVyr8NtToB2paaVNXZ+kcFLQ0945IBzsNdVJPSIn3JBNL+M42w0LGRpvJn5moMd4gusjIttAsiHAbMh0AAaewgA6ATS8ZMmQIE67+3vVY6VT8W8Q3UaLAEMYabpJ8yGJiDI+Ixp0O8UxY3EKLhshmWwsIVA/wAQqNW7Rm0j0pIe6eUaiIIOx7yPnrTA9/zEV7iurNrKfC2sdQQCd5prqBQEVjcsSTDN7jQs/wCCzQIIcjK2gE6SdM069qq8I4wLl1pYxBZtwu4iI3Mkmg2KwRyluUiJi4Ib+k+tEvCmCY+bcbWcoHoBJP7CpnxIqFvMcrksF8QpxLH2Th8Q5srKhcrEAPLOASvXNuT6TQ3AeIrflhTowECQFG87xBnUb1b8T2cuDbUc91Rt1RS2nbekjP3E+/7UzAgfHvF5X0NtOk2OPWhuAo9D/Terlri9pvhcFj6bx3+VIvD3s3CqldIHaR3ond8LLc/w3JB0B3yHudOYdxvUj4MatTGo4PYsCOFnHWgRmZPmygGAe5rYeJsMOQ3kyZdcjpcbfZFRixf8u5Fc+v4C2p8pWAhuxaSq7htiCfTrVngmF8m4HGUNInOAVHTfpTBjx4t51M/EYOPut4XcU9nyU08tLhPmMVBCsP8AW7GTGgCa70r28I5tksA3aBDD1JGkifzo5xfhXmi7fuMHEzCXGDLBMZFuBs8j1A09oJ3MMb3Dy9scyJ5gEiXRBLKQOoUM3uKY+XdQPMBV5iJh8Q9o5cucbxGv037bUTw/FV0KMV9GBI+RoQyh3DEtl0JZQSQNY2jrpWWhvooUdG6zpsTr013pjY1bfgwlyOu3IjjhsddOjCexBMa6GCNRpUV5LSmVveXc2gjOBOhMjYxNL/C3v5oshj6MQUj70kwYq7jozjnST8RT4Z66nf8A4pSqwfmdlfUuwhXA8HtZIzM4GpIEAknWDOg0G/apuM4u0l23h7Ds91Ei80ypeZjTXlH9NxVexx63ZTIgFwgfe5tZJiDWWvETOxLpaZjoM9saydQWUhh7zTtbGwFiNHBJjJ4X45bsgg2jdukhcxYiIPMQNpgxA/StvFOHPnz9lNpWVfLXKsSBOVTaJUddoI6iqPDMZhRqgNhwBMN5iSBzDnkjWevsaIcFxhF2bl3zB90kEATuY2+YpJz9tCrRhxBm1LIbmJbDgDEW7gRxHOA6EGOuhI9xRLH3gtlLtuytyDltgH+WytqVUgZlYEg5HIETB6UC8a412xF3OWycosj7jW8gHmA/eB1Ijr6irHD3NuxbQjV2zAd1AM776j8vWhC9sagOeRNB1bQCty7ib58yMzMS8DLAH3Y+7EAR2FMN6xeZEtWLgUo5vM+bLlgGJI1EA9O4q/i8Ajq2JUi2XjOZ0e7HLln8f0EE1HcUW7i3VCFHGRSTCZgoVnMHWCpknQ9Zp2NRlYZF+H/bincquk8ytgfEV+9/JxC4a+pyk5kzucvwmFHMyk6A+tMF+ybt5LTC2i23NtBbGVSCZZyNg0AjfqaTcDdZL6xZJVv5g+JFYJ+BhHUiY2kd6PcawuJsJ5qgMl1TlKEmGcmUYnWRt6+9Mf8AhH3+kFRtZ+0e8ThLVwgtbRoECQDAGw9qykfCX+MBBlW0BGgfVvnWVmswdA94X8acKN20SPiSWGkyIMj5j9K5xicHKJcUAK6qSJ0zTER29a7VjU0IrkfifhfksWyuiwYZZe2Cd8w6fSDQ5LhYjvzAOOwZ85GUhcqSX3jXQ+pMHSreJxOW3uTI3Y8x9T2HpUlvCsqh7xOvw2wBLaaFtNB1oLi+IW2lXECYIBM+89BSeaAN17SkD8xjRxR1tWx6D26dKWcFioC3CzZiYhTqZGkacsjTSrPGDde1bIYXEuDlMQVYbo30320qp4f4eqziLmgUsACRII0ZgDuQZH/MUSYwLYzNZ2AmcYwmQBAWBbUoNkQa/Mk5qG3eEO75EGZ9io16AxJj+walvYq47Z4+OQG7ZTz+3Qe1F8AuRIzazJM8zH9dqcWKDeKKhyagXhvB2a8LRUg6E+g6nT+9KY+LcgyA5QAAI7AQKscKC2kNwjU/Mqok6/32qrxV8p5lVgx03kcuokGDuD9PYzMzPkBvYRqAIKgS89y5dzMxLBFtAjrl6D0Bpr4dgHS0LSrpMkzGZj6flUPD8EVIdwoO4gENG4LiYnXQCOlXsfxEW1IEm5EDURbJHXLu5HTpBms6jIXOhfvOxJRswH4reQtoDS2AJ7sdWYdx0nsKUbgg7U24lrSIwuTmCkiBMklVHsBJpbv3GYlYKjfm1P5VT0+yCKzUWqe4K2DlLaS0Ajc6wfY9aKcK4vctNBOY6iASIA6wNOuntVbhuGXLLozLBUMDlCE9V/E3prWl3BlYuAMgB5Q3xMfXTl071zqHBBmo2kiNPGuHLcQYi1IWQt0dCzfC4jSZ0PuKGnBXA2VblokKWjMen3TCnnPQU0cKxLM72hAQqcy9DymAZ9T+dIZvFXAQS2aSSJJO0f8AXep8ItaPiFlZkf0w5huFYhmUFrdrNMFmbXuyhFmOusUW8IsVtXJuQEF9S0H4cjZmETMamOoqTAD7Otq9iLgZmYZLJDRlMySZHcbaete4a3bS265W1W5mJOkElPiGxjr0ityoQBp94GLK7E6jtUHWvGRV38sHKzGHKL0MLoByjfvUd2+cUGYlHgzykK0jqMwnadJqvg+EYeHu3bk2kExBUaavtBaCQBMSZqmuJtPdJyCxaytlRSSysFhCY+8WEkbRIpzJyVhKw8yxxG45y2GR0MDQGM8zDEsNF9BI0oTxjg93DFDfEh9VdDIP4hzAQYo0uFum2IxIzFhlzfDptMTlE6a96OYRBiUODxSlCyhlzDmtv910I3HrsQTSmzHCQa9Pn+804g4NHec8SCYVY31kzHyqyWZdmBg7dRse0Ef0q/h+EPbuXbbLzW2yN/pPRvYyPqKiu4TKQzbfe6QZKx8v2qo5FYkRAQqoMb/Cdy26FoUkqQRGsxzD5rJ9YNZiODC3c8zDOyrBYoDordConUd9BGm80E4dNhiRoVZQ0fhbVG9daZjdLNycpOkA/eIgxPQzMV52QkEjxLkF7mEuJql1LeHxAAzRdsXwIys0Zg46oWlWG40PrQnxTwe+1wFGS2LChMpYKwmCHG2YNOhH4TVziWHe9h0EkNZuDUKXgOCjggDMRmyadKq8Qx+XDrcv2gzoD5OZtjpNsOpzKQCGyEjcetMw5DpBI+X0/wARLrWwk/BrZxWBu2GMsUOWZ0uJzIfWGUfnVD7DfRbVm41u6qkshRiyqYAYnMAUYbZSOlR+BuJMt3nAAZxIB0y99zroa2wWH8vEX7ZzZVusBPQZpE/LWlo/bDr89vvC0EsG+Up+JuJk3bdgnktoBufiYZm9pkfSmXw/4keyq2QS6OuXIZaSdFKRqDP9fWk7EYi02MthlV5Oe4szJ5jl98oGldA8CcSwV/McPZFm4nxIwGcA7MNTynbQ1b2yaYGJOUAFCIwWsNio1dB7yTt1hayiyivK7sj3P84ruH2Et4ixppS5xvCgIxIHz79KbHFBOOYEXrT2ySMwiRuPUUbjaLUzlPE7QW6vKVBknWZjSfSkbGooZ9QDnZdfuidzTxiMNcny2/xFJAzbMg0aT06RQXiHhm475gyevNvGk7bxpNS4AUbeXZTrQVBHCrwCOhMgddxroYntvTTiOE/aMHY8pgzC3J6Zp+I+8zQ3C+HHTN6iDzKfpNEeHpcsEKuWFBhJkdywjrvpNPyMjDaJxoymAsJgQpysOZQdwYWP3MzNW8ViAqSnxToMupB3YnpEbRrO4q7jM1wkud+ywT896iMINoMRJPTtprSu6Cd404iRQlK1jLgH8wCI6nU9tBVrD4jMFLIBDFlLM2m3wrO+h19fSqeLvgbZR6xqfrrVXD3yzAc0H70HU++3rrWWzfAKmrjTHuxjEvEew5pBDbRBkEdu9CcZiZdQYHNmPck9T9K1weLYAwqsh3JRTuCCMzDMD2C9danXFWQYNvU6NyGSO38w7aHpQDCVNzvxKHiQYsG5C21Ls0MCuuWJyqTsO59xW+H8O5ZfEXUSfuA5m+f/AFTDwdbdwhbbG2qiSq2BzgazKdfWOlbcUuW0Vns4nDXUEkhVbOI+7zfF7zROXCgLsJC2Q3cX7lxFGTDWyI1NxtW07acoOhqHHYpLuQBXBKrOYyoYE+YUbTMCI0I0133rTF8cvkmCEEwJQBo6cuutRcNVr1xVdyQTLZieYATtsBt6609V0KSRDTcgRs4FayedfZgbbZ8rbB/igqDqBAnXYUv4RGzMEs3nJ1LBVDajbUwg9dfnRfxSSjPaIZVAa0qrAUKrrmIMfG7Kuv4RpvQ3AYgWrYzsX11WFJEknmPfpQKBjSyOY7IQ5snaDsThsbduZ3Q5goUSZhI5VAmjPhriilRYuhsxYhMp+Lm2G+sjarH25brhLVq2Cfi+KEEbyTI9YPUUZ4Xg7WDVsS1q2PLhbeVcue42iKN4liJ9JpWfIGAWtzxU7F7jiecS4B9ltsicxKBsjkMyOz5lQ9DJEajTMKS+G8Fa6M6nMSNekd5p8xnEVvpdWWVgpltBneeYklZZY0VREaGk7FWPLuh/M0uEZlXlLDqzQYkka+pnrTF1Lj03vCUW11NreNcZbYYsqggK2qAEQRAGswKLrg2t2RcZSrIVIIMwlxXIVj0IyHQiRUGH4jYsX84tjlEKpJ+KNH0OpBgj2qtxq9jLjnDizdkXTcYlSCzbSxPSCdaWBqSmj22IoVCtzGfzExBX40Nq4T94qJSfULmE9gO1C7/CWu33VnAXMH9SSPvRtPbuSaOcYwotWLCOVDZlYidQkMpb5kkDvBpexfGSuJuMTPKAM2sADQa9B+VKxBwlj2H7/wBpjlSaHEkw65ibR1DZrOb21T3AMgelWuDWGuqrzzAhSCSJjRojaIJnXpWnhZQVtOTp5qNBkz/NGg6bT7zRPAYY28Rfs5dfNYjpEy8a67TRE8sBwZo22jBx7FGxhrt+zulhZBgkMrKCfUK0NPWIpR8O4q1fDpfQXUcHMJhgSZzIfutJnTSnR/8A9W8rLo6Op3EjlkfQmlKzwrC22lQ6nqVc/vSny0pN0buZjG+mrge1wi5hMYtoMbgYqbbAR5ia5TGsHcEdwab/ABBhmbiFxACjPbQagSCUCM3LpMLNXeG21Uh7WRnGi5/i75QWMDXoSBXvh/C4nEY18RfsvaCjKqsAAvZQfvalmJE6mmYMgzEn6TMnoH2Mg4d/DfBj/LY+jMYpz4PwCzYEWraoP9IgmiuHwwFWSsV6QWecWlYWwOlZW7GvaKplya8CKqXzNF3Sap38GdxXOh8QVac98TcDWTfCtnH4Sdtjp10/Skn7b0rrPGMO0GJB9K4bisRFxx2Yj86QEHEqR4WOMio/tZ3oT9prxb5OgBPtXHHcb3IRuYuarO0ncamNf70qjfxBUxBB69P1qUMywwTNtzHRF1G3U0Qwj2gNnPiEOH8LZ2IAzXDOh2UDc+1FMTwQBMt1yAoBAAj4jv26UNXFG3z8xJBUmYyzsV9zoQfSpLPE+VrYXNlaQGaVNvqBm1DTrTBhBG/MmUEtbbz21gLUEhWyrGuYmNfoK1u5dy7jruG+eutDr+ONvOisGRyDI9Nt9R61EuOP/dQujq3M9BEQjiMXBMNBLi6pIgryyZ6j4hB9daP4rEgQuHsq91urW8zJ1LARB33OgpKwuMA1+u9H8DxEGJmPQmfqNqnyZWVgWG3yjTisWN5WxHC3xl1XuOhVLeWUAALfekgCSDofeh3FuHvhStwEwpkTqD067UaSxetupsk3LZbYbrm6MNtfxdaC+KfFXn3PKyjyLbHMDJD3FBXp0GsDuSe1U4v+wWDtJ39BEq4nitq4OdyG2jXU79Ki4C4zl3QPbDz5eozaanQ9tR2NUrVyWkWxOXLl0IJJ5ROsarJ7RHepLDoi3AScwYCQARzRnJ1n2FNKlRpU7wQQ5thtGDhtsDENkgqBI6bzO3XQUb8U4a55dgQFRpcMSfj6kLOwBG9CfB1kMUDEyzT+esz6CaIcS4oWvXGXVcwVARmACgAwCO4j5VC5p2f22H1lKLdKPrBaLB1LNGhJmB8hofnXrcLW4hBdRJ9ySokCBzST1ofjLjNq2/rVOxYZiCHy6iZMfQddtqLEb5MpbGFFy/hMPcw7guioQJHmqTM9BprTTwe/jMRcy271tAxhVbnVFhmCFjv6dfpSjj8ZcUKwaddRoJ9NND86iw/FVUggSzfhGgP6QBVLICo2uRs5LGyIRay91yt5WF7NOYk5SolYEwCJ1n5Ur+KMJdtYq5buKUdY0MbHUHTQg05Djd4rbtXstxLZ/lsJLBWIlPUdIO1WOI4K1j77PcLPeKItlbYIK5JEOp0aRvqIijxlQbiMpPEoeHrnlnD22+EQ7D0XYfM/rXtgXrl5nBLEsSBGYkCeUSenT2qlhXe3euI4K3I8oKRBU7GQdo1PtFMnB4tnQAgCB1E9/T/mo3Yo1HzKVNixGfGsn2TMtwt/KuXGBGUhssMAPcR1pDTGg6FVn/UZ/SKM8Yv3WDWkGaViBEgMZO5GlJ/EsHetGXRkB0lgYPz2/OifF3twKE7CypsTGPD8ey8oIT1A/uKd/wCHnELl17qM4ZAuYTvMxoe1cmwjpEA5j1A5jXUv4SYK4EuXTbZQSAM6kSv+knsekdazpul0ZbWb1WRO0Z0RVqO4a3Y1H5TNtoK9eePKzHXesq+uAXrrWV2kzrgHgHim1fUMjhlPrsex7UyWb6sNDXytgcdcstntOUb06+hHWug+Hf4kgQuIBU/jHw/PtWLlVo7J07LuN52XEYYNSV4i8AYW+SxtZWP30JRp76aE+4o1wvxGlwAqwYe/70ZtYxG9PetZAYkMVnBuPeCXwwLAeag6yysP94G49RSq2bLGgHZRH/J+dfT2N4cl1SP0rlniHwDesZnsoLqamB8Q+XX60p9aCPxlWPqnML2GOjRAPXePfrWuIxbO6jMoRPhDNlGm0+tHLyurQUCnqrCKjv4GzcJzWyhjoZ1pCdQb3lT9P5WR4fidxDzWs2kEqQy+9eX7Vm7LqTaYySjAwCOo02P5VXPBzPJcHzkVs2EbLlYGZnNIaPQdQD+wp4zqRUQcTA3U0x1hCw8vMFgTmMnNGsQNpqFMNHX9a1xGEuDWf0E/SquRgdf1oWIO8amqqqErYg6GPTXT61PhmM6H5TVLGWZC5ARygEk/ejmIjYTsKrXr5UDXQbtE69AKS2JX8xgzMnIjbguJvaYMAR09COoPpQ7jHCEgXLRPkswm0NBabbWPueutBeHX7x+4zjbXSmfhuMeCj2TDcp2ykHoY1qXS/Tn08fWObTmHG8U8DdJU3dlHKPVgNPyn61TUl3YkkSP0/v8AOivGsJ5V0WwwuWyC6LOo2GV47R86D4hrgMk7EkCTAkyYHSvQQWNQ8yJ3ogGdE8FYtQkndFPqT3r0YsZQuVJYttOZWDZdeuvxR60D/h9jD5u0kNp9Roa0uXit+4gUvluOfQc7aEnt+1Q5Mdhl83crxsNQPyjCl5VXW1bcx98MddYMBh9PSgeYqYYDmJIgGN+kdBWXMUWJDMokbKdte9RZ1X4SSfTb596VjQqKaUBvaQ+I3yrp8JCjKd1dQDmjcAk6H3qpwzEKrOGU/CWUDYkxIPynapMXjyQ2Y7d949KCriVzqWmBvG9eni3Sp5vUVruOvhjHWrTedemVByAywBiA0DePWjvgq+99nsqQgnNbut8YaCd+xP61zq5bZoh8yn1/KuoeDOH3FtI6wp3AOsDoPepOoNBVAveOQLRb5QZ4ivi5es33gX2tlLk9chgE9zuJ6iO1XeHc2ULqzGB/Wmwfw+sXnNy+udj32UbhV7AUx8I8JYXD62rKKe8Sfzrm6Nnix1KKKAgPh3h8DmyiTuT1ohe8K2by5btsXFmcrTlkbGKaUw4FSZPlV64zVGRnJvYgbh/AcPYHJatp7KB+1EgGOw+tWBbFR4jFIglmAA7mmKgHEWWJ5mLYHXU1mKxKW1LOwVQJJOgpF8R/xOsWpSwPOfuNFHuf6VzLjfiLEYtpusSOiDRR/X51zOq8x+PpnfnadN4l/FHDo5VFZwPvAaE+leVyDOe1ZSvxHylf4NIJmoy1ZWUgRplnAcRvWDmtXGQ+h0PuDpTpwX+JNxIF9Z7sv7isrKYmRhtFviVuRH/gvjC3dAKMfoR+1MuG40DvWVlVTzmABqb4vBYbECLtpW911+u9L2P/AIaYV9bT3LR7A5l+jVlZSzjVuRNXIy8GAMX/AAzxC/4d1HHrKn9xS7xTwlirXxWx8mQ/vWVlR5umRdxKcXUuxowBe4fB5tKq4m5bQ5VWW/vvXlZQYsYJ3j8mVgNoIxGJd5ERHQH9TUNu/qABDTMwD/YrKyrdAGwkRdjuZewnGOrqN9xp+VFW4/aUK2Z52AA/sVlZU2XpkZrMtx9Q4WpC+P8AtJMWFDEaMSM3vppQm7w9zy5Zn1H7msrKV3Di2WGcQfcxx8JcGGEtPiLp2BPeD0GnsKS2um5ym/DMxYqFbdiSQx6xWVlb0J7gZ25uTdQxQ0sgOFuKM8grJE+0Tp86mtYx1UnTeD371lZVRQMN4C5XHmZdwT3IYxBMfSpbXhS9caLaZj/uUf8A2Ne1lJOQqaENlBFmM/BP4UY+4QWFtIMznn6hd67N4b8JeQo8x8zD8MgT3rKyqMaBvUeZM2QgaRxGZLIFbxWVlURU1dwN6E8U8R2LAJcnT0J/QVlZWgTV3MQeOfxXWCuHUk92EAfvSBxXxBiMUZvXWYfhHKo+Q3+dZWVFlytq0z18eBEFgQcrVMDWVlIuPnuv9mvaysrLnT//2Q=="]},
-    labels[2] : {"texts" : ["짬뽕은 맛있어"], "images" : ["https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcT9E52mxGpjN8Y5GmLYtiBScsyhXMShoi7crA&s"]},
-    labels[3] : {"texts" : ["탕수육은 맛있어"], "images" : ["data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxQTEhUTExMWFhUXGRoaFxgXFxoaGxoeHxgYFxkaGh4eHSggGh0lHRgaITEiJSkrLi4uFx81ODMtNygtLisBCgoKDg0OGxAQGy0mHyYtLS0tLy0tLS0tLS8tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAMIBAwMBIgACEQEDEQH/xAAcAAACAgMBAQAAAAAAAAAAAAAFBgMEAAIHAQj/xABFEAABAgMFBQUGBAUDAwMFAAABAhEAAyEEBRIxQQYiUWFxEzKBkbFCUqHB0fAUI2JyBxUzQ+GSorJTgvEWw9IkY5Ozwv/EABsBAAMBAQEBAQAAAAAAAAAAAAECAwQABQcG/8QALhEAAgIBAwMDAQcFAAAAAAAAAAECEQMSITEEE0EiUWGBBTJCcaHR4RQjUsHw/9oADAMBAAIRAxEAPwC9ZLgnOFFkNUYlV6HC5grPujEXK0/6X6tl9OUEggnWPFKSKEl+T/WPIz/aeDFH07/X/ZojHJJ+wDXs2D/dH+k//L76UiNWz6xkpKvFj8afGDxKT3V1/Vl56RoJtWIYiG6Xr8HUOqpnTWWPkW51lUgsoM+hGfyPhSMXLBy+/v7aGcWcTfylh0q80nRQ4EQnOQSlRcgs416cY9OK0q0JGevZk6Ukff3SLUqa3T7+2iOz2aYR3D409fs+TWfwC+A84vCTJTURjMnDJl4faGInj/4imREVhtkyWnApONGjEYh0c16QS/EyVJGJWHhiGE9K0gSVklsAryv6z2ek2alJzbXy08Ygu7aqzziQkroWfAoj4Ow6wjbW7KWxdsmzJcrtZSlYgQuWQ1KMVg0y0yi1YLJeEksmV2aClQVitaEp3t53SrGFAlnOI0zzJWMV5YW34OjybQhYdCkqHIu3I8DFywEhbvQZ9I5ts6Pw04zZ1olrJSUiRZQtYUSoF1KVQqd+NTHQbrmLXvzE4BmmW7kc1nVXLIejwjqlsCbqO4xyphEWDaaZ5QNRMiK8pjSlV0jTKCMiOKfxbkSVWpU2SjAT/UYbqle9yVx4xz4iOjXylRmKetcl6/tWGBHItAWddKCWKSlXAskno+6rww+MYnlVnoLC0hZlqLZmPSowyJuEZAuRmGZQ6jTrlzjdFxh/v0y9DHd1B7TCn8NbFIKzMmuZqSDLB7o/VzVw4dYe7faXyMJV2WHsyG+HzFT8FdYZZJcZjl9NfKp5Qe5caAsdSsjnTK1dJOrODyUNeorFZQrUhJ0run9qtDyLc3i4vgR4H7oYrrBwnCyknvJI9RqOYjPJmlJFK0rLstJ6gV8tfCv6Y0QS1GWnz8+B+MerAAo4T7h3h0D1HR25GIFgYqulWjkgnorXoR4QmoNEFtuWRO07NfEU8xkfGvOFi9NmZ0tyB2ieKfmM/WHIu1Q7ZvuqHiHSfIRtZJ+MOgu2YOnjDRyNCSxpnL0HQ5iNnjot7y7KoNaEgL0wjfPRqmFeVs8VqKkkol6Y2K/EBgPEvFe4vJJ4n4ARiCDFuuaZLrRSeKfoa+sB1UMUi0+Cck1yeR7HkZDCn02BTeLDhqY1mKlnSvT/ADGkyUcypP8ArT9YpWq0Skg4rRKT/wB7/AR8+j0XVydLG/qv3PW7mP8AyLwWn7Skx4uS7NVuHoRp6Qu27a6ySgWKphHAYU+ZjzYfaBd4WpaQyJElOMpR7RJZIKsyKE+Aj1eg+yOo7ilkaX6v9jNm6iKi9I1AYEkPvqDONH4HjzjeyXIhCRh+Ar5lyY8m2crUWID8YJ2KYuWGLc9R4R+t2hsjzU3LcrC6n0V4kfSKlrsYBIxOo5JSPODEy2Ajep0LQPM1GaBxqczX0hHlj4Cos1sl0g/1FeA+sSXlc6WeUSRqlWvT6RqZ/Ax6m2EdIaM0znFoRL62OlTwTIAkz/ZbdlrPurSKJJyxjXNxHL1XkpJKSkhSSQQQHBBYg8CDHd5JxrLZOa/OOL7UBE222mZLbCqaojzYnxLl+cJkUasthcm6M2evlaJ4mE0GnD74x2G670ExIPGOM2WxHMR0HZFSiAAknoHhsGWnpGzYbVnQpJeN56MSWjWzyyAHDdaRbTh1Un/UPrG3UjFpEq9dlgslSVFCvgesLFpuOdLdKk4k8QMSfFPzDHrHW5xS2afMQCtUhCvaY/D1jHm7S5dGrDPIxFuS4e2WMRUmWkjECcQbQS1d5Bp4Qat2ywKgZCg2oWrwcKz/ANWIwTnzUy01qfaP18IDqteJC1kKUgM/6d5nOrc48ueZ9yo8G+MLjbJ5WzZYutClpzSFCnKnzziEJY0qdXof89DSBkq8fz0YiSqoxpV7OgXxaDV42FSWWASg1CkVb9yaEa92nKLwyanQk8emjTC4blrQj0p5DkYpzk4Xb6N5sH64ehjYLUzghaeL18+PIsY9lhxuqqNHYjlo3Sg6w8gIFzmJOh1b5gsR1NIhxoAwLDo4t5RatcxKTgYqUPYQASOuSUddzk8VvwS11KsA91BdR6rOfQMeCjEtJTUDfxolKCcWMZBBcq/7SKgR7aJ05zgQqUHqBvTRxJLMAeWLrEtttH4aR+VLbHMIUpKmWCnAsIKiMYChj729zpCLbb+nqUSm0Tgk5DtZlOVTF44rVkZZadUO9nsSkTNyUs4hRbKKjTMkjPlG9ls85SmVKmjn2a/pHOlXlOOc6YesxX1iIz1nNSj1UTB7HyDv/B1OZdc0VMtRHHCfTOBlv2bSuqpeE+8CEnxr6iOdNGAQVhrhgee+UNS9kFvSdLbmpD+O/GQqtHsU0y9yeqPsMZmzmJC3wh1JYFx7ySzkRpLtcw5zGByUEinI0pB+TYUkjA6SApQYOlhVRTV24yyKaHjtPuIFJmyQApLGbKzSQclopVBz5cmjNrNHbFS1WKYCMZKnqCS4PSHH+G19Cx2jGf6axgmcuB8HPnGt3WeXgIKVTZJ7yM1yjxTxHP7O1puMywJ1nV2so6gORyUBHLI/BzxqqZ1u8CFhMyWp0nJSTGlkkTSMS5u7oAA/idI5RJ2pnWdLyi3FBqk8aQSs/wDExCxhnyCniUKIHl/iKuSnuZXhlDjc6pItSE1Axc84knWtUwN2TjiR8zlHO7Ht/ZUhkmYBwxJLeYeLln28E5XZyJM2as6Apy4k5JHM0gJeBafsN6LOhL4jXkaCKdpQohk668vWIbOlZ3puEH3Ekqbqo+gHjEk+3JQ2J65NTxMFuMFcjlCU3SBl62KeuWZMlaZIVRc1W8pv0JT8yIEXZ/D+yy2K1TJpHE4E+Sa/7oZrNakTO4751icoYF/LWE78JLV4KLHKDoErskmUlrPKl43AOFIUsDXN1O0F7EVzBVKqAcx5Zp8YEy5kkL9oFRqQXYs2vTKLl7XgnEzhQIG8AxfNjrx1jLHqHeq/oaniVaa+oQwYGUtBKSHeoHiQKdID7R3uUqQJICaZDecvFG67/WhJTMDoBICVVB5kBoiedaFiZ3JaGOIhgWL4UgZn0gZc7nGk/wDvzK4MUcc7kk0Fk2pZw40gFqhyz1Gh+cArZehluknf1PyjLdeOIkBvP7ekBbQxJxDEpJevdPVzXLhGfU5StsoopeAyL5xYu0BZqKpwH1hcF9rlmalWHslhQYuVENkAOuZ4cogvK98KMIlpcVyPEMBk1CTWlIXHXNmJKiQ5yYsQ7lqMwHMxqxYvxM60uUNy7EpCZTJY4AoVd/LMuCIdruW8kpmEpKsgDlVxrxiBNjRNlpBJxITu1amZf6xtKtksstKQwZg5LnxzLekZ3Le0wS3VUQ3hYpksY1S1KcH8yW2X/wBw9xQ+PKA5UVhMyYrdFCJbpAOVVZ+Awp6Zw3TLVNYCzkIJYk4cQFUvukgZO1YDS1TV24WeamUEKOIzpSGxJUhWEKTUAumruairGNsMsZrbkyuLjyDThCcKUpSB7oATy6Hqx4YjWICNQfvX7Pm8MV7bITZTqkb6dUZU/S7sP0lx0hfxAEggpIzBBDfMDm5HBSYMkzotMjtkrtkKkkMVjCkkd1Y3pR5DFTkFmOV3jJwqNCHJpwUKEHx9Y6wo+yQ40+oI9f8AnAS99lZ1qmmbZ0oOLeWFLSlpg3VjkVd/Id49Ithl4ZPLHyjmsbyVkGlYZLRsPbQoj8JPFckoxjwUkkHzj1GxFuy/Cza8QkeqhFiNMV4yGWZsNbgWMjCdQqbJT6zIj/8ARlqHe7BP7rTZx/7kdaO0sXo9hzlfwxtygCEyiCHBE6Wx+MZA1IOl+wz/AIP2wrCxClEZIUQyZqeMteSh9IkkyCl1JdCpZ3gKmUTqB7chWbaPBOUghiwBcpwHIL9uSf0r7yeBjUoKSgy6ZiUo/wC6zzOhyeMTVmu6B826UreZK/LnJGIoTkoe/KOo5RvYLViViQyJ3tDJE0cCNFc4tKQFAzJIIwl1ynZctWqpZ0HKKs6WidvghK3otsKVH3ZqckqOihQwoxUv25haEmbJDLFJks0b7MJU6xEFiCDwIYiHdFqWFE7yJyKKHvAaHiRodXhnsWzMq0Kl2qcncZ0yyKL4FX6dW16ZvDU3Qs2oq2IezWwC7U02YTKs/vNvL0aWD/yNOD1bqF2XdJs0vsrPLEtGrZqPFSs1HmYJTZSiHCS2jCnhyiuWAcxo4Rkbtkc+aEhz98IUrztJmKKZhqK0oG0byiXa++8KOzQ2NRZI1/c2dIXVWgowklSQxxGapkqoWbEQxfIDp0xZk5vY1YagtxiuK0YVqCCVHCSXOQDV8z8YsT72WQyiwJZ8NOdeNYqbJoZE60OjCsGWUjvOKg/HLpGkyeysChunI9YzyxcbltVti9ar3/NWiWCphQ8S7+GsGRbEzJQrwxDUHXpA27bsH4u0KWwQgoUN3EVPXC3Chfy6NKrRIKw8qWhQbIBJJcFCjhYHLnnCzjBDqT8CXbETlzDJKihABda0kcwwLFT0y4wRs1+qlyZNnJxJcoTM1UpyoJKXLZsK1pD1Nlyp0tHaISsglieD66+OcC70UiSFI/DSZYWH3UJSFaPiapHGHlPHVCxk34FqyXoyt4EDPk4dz1Y+sa3wpUxQRLGfDQULmmrtENttGFKkMniD96t6xHs7PqV4zT2VcWfyjkvxDsHpshxkKIUXYvp/iC1ruQITLAAKlkBhQ+8WPDdbx6xUm2l1KmYQ+laRL+PmLJmAt2bAgb1Tonw15w6k7C06ClqmTJEta2K1JQTXmPi1fKKGztuchJzFB9I2tE+YbIuasnGzB27qqE9WJgBd00pI5RGa9Lfmzb0sNVxfDOly70AUA9f8GLd1SEFS1ImYFEuwLaB1NmRCjJQta+0AOFgS2b8AOZc+Jg0nCVhaSpGEYcJAJfVzRujQmqlaMk8dS0jlYO0ExgoKTnid8VatE17XHKtI3kgKzChm/r4gg84Sbzv9YlJMssCSlxm7Vb/HCLVz7ZrwMveIoDqf8xpw9VCC0yROfQ5ZR7kP5B963ZMs6sKklid0nJX7TQE8t1fJUDVSyWXKWULFKH/axFehAI0GsdBsN6fiRhmo/LUKhQzGmfhWF7aLZhcolSHXK4jvJHAhjTgwI/SM40xepaomXdPTLkA/zy3JDY5ZbUoIP/Jh5tzEULSmdMmiesSFTA2FZTMJSRUAJMxgdWZzzzi5NJSHJJHvPl1LlvEkc05RqlfAghq005jQeaesHUxqRRN0mYVEos2NRc45ajiJzqVFyTy8I8VcJduzs4Pu/h5WLqlxhmDkC8FAp6fD7zDdeiREsu0EBiy0HRVQ2hBq3xHAwNbBpQKa2CgtiQBQB5aG5YTLdPSMg/8Aix/1JqeVC3iZSj/uMeR2qQ2xbtMgAnESoYQJhHty/wC3OT+pNH5iNJmZE2oJCJ37v7c9PUNWJkOWQAAoFRlg5BX9ySf0LFR1iOUAxIBKMBCkl8Rluykn9co+aWjhWDrUVypgm+2g4Zv6knur6EUPMRFfFlEtYmS2wzBVJAYuHYjUGCU+TuV31Sh/+SQrXm3wKYhTZFT+xQg4lBYSToUkOlZ5YanoY5xvg5SrkIbNXMm0NNmJJRLIwuTixCuDF7cvrXSGe2W4pJEXJcpMtKZaaJSGHzPUmFi9rSQ4zP2IXqn24KKExf3JtkF87WJkkJJUtaqpQkh2BqS+QHygTeO3iDKI7BRnZAKIwhTsxwrdVeQhP2vthk2kKWkOUYdKMXIcfu+MKc+2halLSlQcuS9NMw3PjqIXDi9PkbJJItbS3mq0TCtaRLJYHdITQUGp8K5wLSpQqFDqCR45QRum7l2mb2aELXqoSxiUBqQ/DnG1quMy5ipK8SFA72JAc6pYPuuDxLvGlaYqiDbbHjZqZNlWNKpyie0WVOVA4UslKQqrglnq2YizeF5pT3RjVmA7Dq8AbKOylIFoUuYlJUQHTLSxYYMSgSqjKwpBPMZkN/Ne0nCVLThSpQShIJqScICiXJ0Fcoi43uh1N8F669o1otEyasAoLApGjEhDc3fzMMX80FoAKU/mE0BI0r5QdsGw1mlhKpuGZNri3U4HUzsltGFSdTxjU7KyJJCpWIFy9ePAeMZcssb45NeK1ybqtE6UUJUElKzmDVNHZta+sTXrYxaJbLpwIzHAg+o1gdfpaziWo4iTmrQCtfKBlxXiVJIJUFA8dKsr69IgoLlBltuJ95qn/iDKWXOLCAMidPNx5w82bZVEpAVMUSCHU1G4imnMvA38KifekpJZpaAuYfeILoBr+09I6NZAlQU7MkffjWL5Z7JL2BBiDtpdcpEhE2SWKSAoJJGIGjkeReAdxWgjEhCXxGp0HyEdElSkKmzEJS8pSasxAJdJDcDR453arMJVoXZkKZIUAG7ynDh+enhAhNzg0XjFKW7GCaqQU4ZqsYADgHCGBdnFTXg0UL6ttmWECRKTLKTUimINlz8YnsqxImJQkJLs5V4v1pC/fF3mVMJQ6kFWg7r1GWY5xOOO3ya8eWMXdDjs1a2wg90uCPJvUxZ22nEbiSd5i+p5k6lgBXlAm47OVylDJQBKTV0kA/ZHSBY2l7Vpc6W9CAS9KM44HV+QgwxtxI55LvNoI29asEuW4wpS7a4j3jz4R7YkPkIL7IJxuFYJiGyVXPTkfsRbteyMyXimSVpMuqglRONIzIyZQGhesSyR1Joti6jRUWWLktMxKkJAK6sAfQHSOiaMRQ5iOd3BbCAlSAVzH7oBoNfh6x0CWtwHZ+Dxr+z04RalL6HnfaElOdxX8iLtTdxkLx4FKkqymI7yT7sxOSxwVQtq+a+uUFJxpKVJfvoLMf1ZYVfub98dZtVmTNQqWsOlQY8RwIOhGYMc2vG4ptnmqKVFRGakAY20xoymD4xryQ07ozY56lT5BGAh+WdMv3Jo3F6DmqJUzD1+Nfg56srmBEpmoUBiaWRRKk4uzfgCN6Qf0l08o8n2YpO8GcUUkO45pFFDmhxxTE7TKVRsghvoVAfBQ9PE5nI0TZFkOEYgclJAUD0Ov3QZD2DQLDEwJbUJKQQfaASW/wBco+aXjaZNIUFuAcQEwjJEwBkL/YtLA8Y2mErwLG6qZUP7M9NFpPALAqOLxEJgAKsLoKd5B1luyk/ulqy5EQQGEEEFAZQKlS0//ukH/knqIObJWBAK56O4QyB7rklYPQ5cHVAUJYKBVlgIXxH9qaeY7iuRhzuqRgs43cJVvKTwKi5i2FXIjndRIrStqwDtqmdWrEnoKwctKHEIO2l5FEtWAKUMlYQ5ao45dIXqJV+YMEbOVbVXz+LnYwCEgEJBZ2fM9fhFKRLThSkklWKvugUdjiophw9Is2C7JjCaCUM+Biyy1CeQ05xfF02makLWslKajET8BkH4wdcUqsOmT3OqbFIkosaFyUDGtI7RQG8SHBSTmwLsMoF2m5JlumFQSgTJailSlulJSQQkkpDkpIDAvC5sntZ+G/KmAmW9FJckFzRtXPCHe77YGVMCqzDlkzUD8482TlCWo1xUZR0iftbspaZUsGYJKw5KlS1qJToDvBIIAowByMc/syzLmoWkglCgodUkK+Udd21kzZwZBJSkAqABIHUjKAC9hZc3BMQtUtVMSCnEhR0wkKcP8NI0Ys6r1E54HScSxY9q5iiZktlU7iiyvDjnEiNo1lIUScQ9li/TpA+VsZPsylTlrTgSKYCcR4PRh5mNLReTEBSAop1TqWiMscL9O5dTbW6J7Vey1uFUxVDuyWzNeAhYuK+FJmFLKXiLBqqz0GriMv8AnKm1yZyRx68Yv7F4JKxNNVkMnkCc+rjyHOLqMYY22icrlOkMV37OLRitKlkLUolTviY5V0AyaHW504rIMQ7znqD/AIjyfgVLKSWURkdfrFaxSDMlJElYQE0KeHX1jE5N7ssl4LWzVjCTNAdhTmeD9BHI9oLEuTb5iH3lKxg5uFb3WlR4R267LOmQkpKsRVU8zy5RzP8AiRZ0IvKVMT7UpJmB9QopGlHAA8Iv0+1/kJkdyC1zXehSUTFh1AF31OjQwJsaCFKEsYmYggF6ZeMALltRUoBYwt3XGQZqQ1ycADpBL0NOJLtw4xOtxpNigZKbImccSqOUgvkUgs+rUrAjZ665c5LkhiXoa9DpSGTaK2yAibjricKY1DBvAu0J2x5lApcYlPWvPNsoorabA2MBlfhCvs1qITvKGZp0zyi3/wCq5k2Q0pGIKBxFbgtkrCBQlubNBKwy0JtJcMCnQUauvifOF6/LELMpIsqyUl1JTieoLMGFAxIDn/KKKe75C23shguO9MEl0BiKHI+X1g/cdoK1glQ4lzwjndjSvFiWClAU5D4SOILAtXlSGG4ULlzK1KSx5tQx0YrWmxJN6WdNSrhC9tvdylyhPlEibKq4LEp9oHi2deB4wbkZDnE6eByj19OpUecpaXZyiTeaJisNoT2cxm7VAz5LTkofDpFiZYZklOJLdma5FUlXAlNVSlcw45iDd43fKUpSJqA4JDgMeR50gUbnnyi9lnk/oVXwY0jFRuv2KRwKqbNNJOqOzWk8wopJUOZMZEq1Lffu9JVqRiAJ4sKRkE6w/bTLWkF2k2hlIVrLnDjwdvMHjA4YgohbJXiGLglZolf7JgoeZidMpMpZkKL2a0uZavdUeHCsRKQvApKg86RurT/1JRz6tmPGDYtEcteEgBLjeAQa0/uSTzHeTxjoEpAEpAGQAA8BHN7SrNQJKSE4iM2/tzhzDYVdI6ZZlPKSeQPwjTg5Zl6jhFG0ikc62ru/FiIURq2jx0mcITtoZThXSJ9UtrG6Z0zn963LMlyCEgEFya8TkH0bmTDHslNkz5CUKUFTAgY0khwQAFUGn+IobV3gEg4T7IAA7uTdfGFTZCaZVrTPL4XKCQ2agcIIzALGv6TGKKcos2SXA0bXXIEhKpQwgMwGbvnThxgnd94Im4Xo26SKAECqfjBK/wC60zU4mcpZiTRgcs8jWEy1gSZi1ICShQ3k8CNQOXzif3lRRVQ92a+ZVjlkEgngKlXMn5mkLX841SwTmhNGTwHNnhdsW1ON0KAerE5kfekHNlbnTMs8yfOGIqKgltACB5loEsbjH1HKSb2Bltv60T5S0llAGraiF0WpRAKXJpoGHlDeBKKzLlbhLuGzLf49Irpu1HaZJDIqzeENHJFbUM4gO9LIQlOMsogvQDp1jpWyGycuzoR2qAuaQFE+6WFBrCbZ7OV2qQhsYx5HRg/iKPHUbXa1S0hgDipmx5dYaU/SkTp3seXnaZUtKlqZLVc9IXtjgpWKYU4Asux5ktlyPxijb5SrTPTIUSDUq4FtBxzh8khMtA3cqAAcKUiIz2R4ux4wHBZOQ+6xxLayTMk3jPSVEjEkpKi5wlIUADwDsOkdzNuQhKlqUAE1LnKOKbX3mm0W2bNlpeUcKEnjhDFXiX8AItg5Yjsc7lnicgLzyFR5+Lwc/CdmlUwrdKQSoHpCLsbalEGWFEBOUe7X7ZITLm2VLmYrdUzjCCxJfUtRhCqDc6Q0nSBFpvATSAUlRUSV1oHyrrWvhEF3bH2hUxUxCpaEuSApTOM2YD6Rrc8wJSOOZpDDLmKwYgspUnIM9Bm44RRzcPSjtCluU7qvhRU5BUWYtw0qYe7LbpakSv6SkjvJUkKqMs8m+QhG2tsIkdkuzjCicl1JFQFBjQvQF8tGgAjGS5UQeVPSFaT3TGUbOpfzeyqmzEIKVOylEMyVMxAOmTtxeIrqWMSikuMRqesI11XaFKGh4u0P1guxUlklLfH4xOTuSo5xUVuPdkWChLcInRFG7i0tIi6gx7Ud0jyJciTtgFS7VillitCSdQW3TTTu5ivWKVjtblu6vRJNDz5iLv8AEMDtpJqDhUARn3hTmK5GA0qclQZbD9Q7viM0n7eMWVVNm7FvBDAi1LAb1IEZAkS5nszVtpkfiRGQo1FtFjYqsU07h35EzhrnGSbQe1kiYcFoSCklQ3ZiKtXidPGILRawtAxjEEJKJqCHIS9JqDnSj9IqJl42s0xQcB7PN4jMB/vKGASBGMLkMZM9JKksaMS7JOqCwMPWy9pVMsqe074BCuqSUnzZ/GEJzN/Kmfl2mV3FnXkeIMMuxV841KlLBTMT3knyPhlFsMqlRDPG4jDMELN+yqvpDXaUNC/e0kqDCpimdXEhhdMQbVs8bROASlKQc1MwYZkcTyGsCL72VXZpxUl1y8wXIUlsnKWqDUHKlRx6xZ91CQzMGaNbdJJDsMOrZx5ik48HoKRyi1GfMshWqa0urJCt4kHCMRo2r8WEB7luucvGlFQ1ATR2f7MdUsmzUlCSrswQal3LvV2NIm3Uhk4QMtBC9ylSK2mcBtF1zkvilLoSDQliM3b1hx2OvdapRkIBSZaQWORLl/gMucPVmtSFWhSCgaP+pxmPSA+3tm7LsjIQEqUrMM+o3nzEXlk7saaIRjokLFtKkLE1iDmpIcvyDVqfJ4q2W8CTjmJwJ4VfOpLwwXJKXMmhMzDRiVe9y5cfCM2rsoIWAkgJFT4ZeYhE09mi0m72KOy9oROvCUJat2WFLJyq2H/+ofr2vJKF4lEFqJGZJPBvuscr2autK1jvJLHeCiC9NRWDNvmy0AoKjk2Mne8SYGWK1JIEG6thi6b3CrX+IUkbiVJlperlqnjw8Ybbhv78QpSZrBY0D1HFo5RdqimUpSRqCCcyNP8AxDLdF4LdJQxnM2FyxHXRszAnCjuRm2ntKPzJQZ1JYg8x8IRZlmlpQVAgKy6iv28G7Jd1qnT1rmFKSaUHdAenPxgvK2Mkp/qkzFEUUdOgFBCKUY+RxP2XuGaohTEAkjMB+dIZbw2WRNWAuSlRAqtWQSH1BfpDTY7EmXLalIo3vfMqWgzFlJSAagPkNOcI5ylK1+gdqo5eLomSLSqUSCihCs3ScvEVB6Qcsk0Y2SFYECrZq5CIbstIMwz5iqTHDEOE5kcmD/bxKi0djPJCRNSKukO4OpbUVi0m29wRSXAQtsn8RMlJPdS4wZGtST9BpDXJu2QuWmUuWkpScgMLEjNwxhGvQ2nGiaoBCVVQxroGNMx84Pz74TLTKJW5VmH4CvrE5bVQeUVbXci5M3AxZRPZkF3D/Ahw7w8WOzqUiWFkdozKYu7V+XxhWXaTaVgl8KQw9XHwhmuG72UMy1SSSYOBXOkiWZ1G2GhKYAcBFiziN1iN5aWBMe2lR5TZz/8AiFMCp6E8EP5qP0gLYgBmWOheh5F8uuXSJdpLSJlqmqowISDn3aEHxePLOXG8Oh+nCMGR3Jno4lUEiz+G5KHIKUB5AtGRZloW26S2jEj4AxkIUIrSnDhmpG+Ceigc0nrEU2UgpSMTSlF5S9ZK9Zav0vlFhBCg3Go5ERU7XAVgjEhX9RBH+4cDzEFMVoknAzfy5m5apXdXooaPyPHnFez2xSlpmpGG0yaKSaYwKKQeoyMbWhJVhRidYGKzTDQqGspR4jKKsw9uO0Ru2iXQjLE3snnwMFMVo6rY7UmfJTMQXBDjj0PAjJoFXkrAMRpz4QB2L2hS+E0So1f2VanofXqYcrdZgpOTgxrb7kNjFp0T3F6dPAIxVB+3ilbL0wBRdXwIPLlE16WaagflJCgNHY+kc22iVa1qOMlI90U+OZjzniae5tjJMZ5W2HbKEiQk4qgqUMm4DX0g92Qw90AgD6xzDYqciRaCqYSFGiSSWL5g9aeUdWtE5Kk8X0HSJ5IpcFU/AhbTJMi1InoLIUMMxq1GSm6UPQROZ4WreViSKg/Hwje/khUvsgjElWJOJ8moannCzcdwWyYrCiUoyzQrJwoYjN8yRmweog46nHd0GS07jZIkLmqQZbAA5UDjN+UL+1Ngtu8AglL1bN+Dax0q7LpEqTLR3iAN4gByNWje+rEVIWQ2MJLDR9BHJ1uJfg4xd14JQgy1DCwILUU+T8QWAHmdYGXvbTOVQdef1gne11rRPmIWBiO9QuK1hw2X2YkJloWtIXOUMQDvh6DoR8YtLJGPr8jaHVCdcNsKZZRMkrUkVxhJNBkONHzEMVzz1CYiciUcPBmcEVNdYap90LQxCUhORZoiMrs07pTT2T6V1jNLNqfA8YV5NJt/9mMXZTGPtMKcjXOPTtrIAKV4wcOgJ8Bzi6ZfbJYISpJG8E1Hj5wAnbPywoNiSoHulmI5dPlE04+RqB21O1E2aky7Mky0kby1HeU9N1u71z6QlT0Wgy8BWtUsVwYiQOg+UdRva4RMl7mFLDeJzA94cxl0yFKr1gshklPaSzMx6geY4PGmGVQjshe1rfInXfPmrWJWMpDsQdOOjiOsbOXamTLJVhxECuXnAe8btAItBQuWQwxhOJ01O8wo3E8YmXbUKSFLU4GRcjLLWFyZFkVpAjjcdmxtmWOXaEpTMAISXBdtGpwzMCdoLhljCEYUsSQCSSRhrUk8MoDy9oFuBJDgakFvAP8AGCNls8ycsLmkk/ARNPwFprcI3LZCAAMzD7YJHZpbU5mBFyWLCMZFdOnGDeKPT6TCoK3yed1ORydGZmKG015CRIUpw4DJfVRokefzgkDhGI+Ecv20vkzp3ZpqhDvwUdTzAyeozpkY05Z6YkcUNchfs0xTut+pz82r0VBmxEGleTfQn0eKFnD0DilAKnqzuR+0kQVstkCgWAPHC2fNOnil+cecz0i4JB4CMitgIpimBtKj4YoyOoNlq0ScJxJfCqp/TR38g3hENqlYgCGB+6HkYvWec8tiHah+/vWBwT3kHSlOGY+/0xzAvYoFWJCpbkEKxS+KVDQfERGqc7WpAZaCBPQM2yxffyjLQhzWhBqeeiulD4xqJplqE0BwQRNTx4/XzggZXvb8mYLQisqZVQFc6nxh82V2lSoJlzFOFUlqJz/QT73Di3HNPnykSz2SnNmnVRXuKOYHm/jAOYVWSYZMwY5KsjyORHD5ERSE3F2ic4KSpnbrVZtRlAe3WBMwMpIhf2f227BSZNrU8pVJVo0/ZN4Ee9rrxh7XIChiSxB+6RopTVoy7wdM51eWzaQFAoCkq0L/AAIII8DAmyWI2dRKVLMtQaYlS95A94E95AALsAoDNwHjp8yz8YHWm6AS4Hhx4jxFIzZMO1eDRDNuV7HZJdCQkJSAwYN90gii2IA3VAjgCIWFdrZhhIK0cQ5UnqDn4QsbTXutQaRiQdV1SeYFIxKLi6NNajpi5pUzU+kZapbCvWFHZTaMTEoE6YlExJIINAoaEOenlDHNvuzzMaUzUlSe8AeT04+EcDTRyW/rYJtsmrSd0HCmjd0Mf92KCOz9sTKndotg6MAV6Px0HQCB0ux4pi1JfCpSil82KiQ/OsX5l2kpaDOSqi6iFBfy0ky8TgOaNkz66RC65ksqxgVepy8dIXZtzEEn4x7/AC9bEOWOY4wqhH3Gsc9m9qJdnBE1lOcKVJ1Z3ePbXtPImTyQ5To1eXGENVzK4GPJd0LQoFLpVoRSDphVWLp3s6tYp8sKYqSyhStWLh65iFi0W5kkWcFaUrKULUAaAVXpR3ypCom6ZhJJJL58+sMNyzJ0tT4AoMzE5UaJtRXkZKtx7u+8U9iFTSlJA3t4NlCnfipVrnJUlNEpCQWYEZ9cyYyz3ItVVnOD913MzJAcw0U5bIlJxi7KdgupKQGENF2XUzKWOifr9It2a7kyw/eV8B0iylZMbsPTxg/VyYsuZy4PVKiaSNTl6xomXqYTttNtxIeTIZU3IqFRL+quWmvCNtqKtmVRcnSM/iFtb2QNnlq/NUN4j+2nh+4jyz4Rz2yTCGTp7hp4oV7JioFkl1kqxVxZlzmTq8bJGH9SD90++kZcktTNuOCgqD1mWFOBXUpIGIHiU5K/cljTMwVkqoC7gaqdQHSYGmSz+52hcs63q5UBkoOFp66/PrBuyT8ionlNQPgsDPy8IiyoalT5jBu2b9KpSh4E1I6xkRJlAgHs5S39rEA/Pun1MZAsNI9l0U2hq3yivbk4VBQNKAj0PQP6x7MWVBz3hn1FFD5+MWSzAFiCmr/+eWcMKCLejIjXdI+HqfjEMlBLjMs6X4jj1EW5ktwZZzdn1ydJ+I8YrqU4RMOYOFY58/vUQAmSwlSexX/TXVCjmhXDwMVkyzMCrLP/AKiXwE/dQRFu1IFQRuq+CtfPPzjWZZzPRhdrRKDoL1Wn6iCgNC/Y5Q37HOfCe4T7J5evnE+y+1Vpu2b+GmnHKGSVFwBoUHQHhlFq12f8XLcbtol6altOLxUVJTbZWBTJnyxQkt4HkYeMmhJRTOv3Pf8AZ7UNxW81Umih4a+EEFWfhWPnq75qn7KZiRMQaEHCoEUdJzBHxhpuD+Itps0wSbX+an2V5K8TkfKLxyJ7SM8sTX3Tqs6zBVCHgTa9n5S9Gi3du1dmnMMYSo5JXunwfPwgv2IORgvHGQinKIiWzY1JyA8IETtkSDlHUDII0jwjiIhLpYstHqJI5vIuQjMRaN3coelSEHNI8orLsKCch4E/WIz6Re5SPUtiSq7eUa/yvlD1/LJfPz/xGfyyX+rzH0hf6J+439UI4urlG4ucHMQ8Ju6XwPnHos0sZIHjX1grovkD6oTpNzgZCCNmuU6J86QxhQFAAOkbMTFY9JBE5dRJgtF2BLOXPKLsmU2UWUyNTFS873kWcPNmJTwc1PQZmLxxKO/BF5G9icIJiG326VZ0Fc1aUpGpPwHE8oQ7/wD4mGqbLLr782g8E5nxaOfW68Z89RXOWVnnkP2jJPhDPIlwNHDJ8jrtNtzMngos7olZKWC0w+Hsj4nlClJl+KOGo++EQWVLmhKVc9eXD78YIJTXe3FaK9k9dQIzyk29zVGCitiJUhqoIIOY+8jGSUcKHUHL75xf7DQuhXLuq8cvDXjG6bODmGWOefQ69PUQlho0s6AC4OFXA5HkTqIv2WayssCjp7Kv8xXwswXyYj7+/hFhmDKGJOjVPCnvDln6RzCi4taHrLY6gFvlGRVTLJ7s0No5T8w8ZChsO2mQXxDJVFdRQHxy8ogsqvZOWj/D6ReUiikmgIY/I+cDlJIUQe8nveoPjnDCntrRhWDk4zbUetCa8ognSKqPszAPA6Hz+UXbcMSXDOmvLJvjEBZSHHDy/wDHygBRTkEdxWR+BGX3yESWqzqYEFpiaoIplmPHhHkyU6QtIqwcfev0iSWrEkDUVSfv7YxwSpbUYgLXJopJ/NRqGzMU73s7KTbJIof6ifUcngjJm4FicnuqpMTpwf5RKhIkzTLU3YzKp4MdPCCLQEvqwC0SxaZHfSKtmwGZ5jI8mgaJAtcoghpifgfoYOzJarFOcb0pdRw6+rxDfVgMlSbVIrLUxUMs+XD0g2ChWsU6ps1oS4Jwh6N96QXuu/7VYJnZGcvsyd0qOIN0Lt0gheVzotkrtZP9QDLi2h5/fCA9gmCan8LPTv1wr1plnrDKQjVjnYv4mzpcwS7TLlqCqomIJSFDmC4B8YYpH8SbLj7OamZLUcsSXSehBMcklSWP4W00/wCkvgdOoPyaJkoJV+FtAdX9tep4NFFkkhHiiztqNqLEWefLS+WJWF/Novy58lXdWg9FA/OPnzEuQTKnAqlmn+YgtFgMn8yQXl6jh1b1g9y+Rez7M+kMCPe+MeFKPeHnHz/ZbdLnjApSpcxswogU41r6wOt1knyjVS+RxKY9Kwe78Hdn5PpAqljNY8xFO031ZJffnyh1mJ+scFu62CaOymnCa4VcC1S/BqdIH22wqkrYhjoRkeYPCB3Pg7s/J3iftrYklkrxq/QknnmzQDvL+JQDpkySToVlh5CEcyUBAUciHDKUk1alDUDhpwilYZSpsxyaJzL5ULQryy8DRwx8hm99s7bNdIX2YyOBk/GpPUGFggqOJZxKJqVKJJixOT3j+op45Fx8PWJpaGZ0EEUopLjjThEnJsuopcFISR7g8APmI2s0pjR0nh/jIwUlCSklJxk1YhmYmj8wPWJnlB2C1AZf5ALtRtc4FhKy1At2iQxbeT9NfWJhLUkAj8yWci+XLl0MWUmSWLLCCSTk2eor045ViWyzZQYjGksA4IZVKgguK5V01jjj2xpGEhLFHtINW5j6iJkyQoMN4DQneA/SfaA+2iaTKkk0xIV7OTE1oD7JbQ/GJpnZYqpUgjXKo56HnyhTrK6CQKjGjLOqTRx15H/ERiWzmWQU6jTyzT90i/8AiJftBQU1VgCvDEBQjm31jJwSCMOJCjq4wqFWI4+orBOB3aI1cHXcf46xkWjzlEnilQAPgcoyBYdw5aj/AMfkIp2k76OctT894M8eRkOBksoUV+0xHIFJg0xK+vrHkZC+DlyV7Efyx4+sRWfvEaOfSMjI4PsSWMVmDSlPAPEdprYQTUiYljqKacIyMjlyc+CzeYexJJqefjEOyoeyzAajEoMf2g+sZGQRAPsaf/qFp0ZVNMw1IobapAtBIDFxl0BjIyD5OJ9tUjsklqhQY6ikQbSB7LKUaqcV17oOfWMjIMQMs3kHsiXrROf7awO2dUS4JcMzaa6RkZA8BQDtgZVIdbo3rLvV3Na8Y8jIZ8IVijbqKBFIYb5D2UvVlJbk+bcIyMgewz5NUqJsYc+76kelIjuY7kz9yfv4DyjIyAd4IrP/AHx+gHxxgP1qfOJrb/U/7Uf8RHsZCscjVG8nPyjIyAEtSz+cRoQHGmZj2ZRVKV+UeRkccErtSCGIcYiGPDh0iWWXlIJqeJjIyAA1kDdPKYw6YXbpFmyVlqBqAqg4boMZGRxxtZlHCKxkZGQwp//Z"]},
-}
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@st.cache_resource
+def get_content_store(manifest_path: str, manifest_mtime: float) -> ContentStore:
+    """라벨별 콘텐츠 저장소 (썸네일은 static/content에 한 번만 생성, `app/static/...` URL로 제공).
+    manifest 파일이 바뀌면(수정 시각) 새로 읽음."""
+    return ContentStore(manifest_path, os.path.join(APP_DIR, "static", "content"), "app/static/content")
+
+CONTENT_MANIFEST = st.secrets.get("CONTENT_MANIFEST", os.path.join(APP_DIR, "content", "manifest.json"))
+content_store = get_content_store(CONTENT_MANIFEST,
+                                  os.path.getmtime(CONTENT_MANIFEST) if os.path.exists(CONTENT_MANIFEST) else 0.0)
 
 # ======================
 # 유틸
 # ======================
-def load_pil_from_bytes(b: bytes) -> Image.Image:
-    pil = Image.open(BytesIO(b))
-    pil = ImageOps.exif_transpose(pil)
-    if pil.mode != "RGB": pil = pil.convert("RGB")
-    return pil
-
-def yt_id_from_url(url: str) -> str | None:
-    if not url: return None
-    pats = [r"(?:v=|/)([0-9A-Za-z_-]{11})(?:\?|&|/|$)", r"youtu\.be/([0-9A-Za-z_-]{11})"]
-    for p in pats:
-        m = re.search(p, url)
-        if m: return m.group(1)
-    return None
-
-def yt_thumb(url: str) -> str | None:
-    vid = yt_id_from_url(url)
-    return f"https://img.youtube.com/vi/{vid}/hqdefault.jpg" if vid else None
-
-def pick_top3(lst):
-    return [x for x in lst if isinstance(x, str) and x.strip()][:3]
-
 def get_content_for_label(label: str):
-    """라벨명으로 콘텐츠 반환 (texts, images, videos). 없으면 빈 리스트."""
-    cfg = CONTENT_BY_LABEL.get(label, {})
-    return (
-        pick_top3(cfg.get("texts", [])),
-        pick_top3(cfg.get("images", [])),
-        pick_top3(cfg.get("videos", [])),
-    )
+    """라벨명으로 콘텐츠 반환 (texts, image URL, videos). 없으면 빈 리스트."""
+    return content_store.get(label, labels.index(label) if label in labels else None)
 
 # ======================
 # 입력(카메라/업로드)
 # ======================
-tab_cam, tab_file = st.tabs(["📷 카메라로 촬영", "📁 파일 업로드"])
+tab_cam, tab_file, tab_batch = st.tabs(["📷 카메라로 촬영", "📁 파일 업로드", "🗂️ 일괄 분류"])
 new_bytes = None
 
 with tab_cam:
@@ -130,22 +153,123 @@ with tab_file:
     if f is not None:
         new_bytes = f.getvalue()
 
+with tab_batch:  # 위젯만 먼저 그리고, 실행은 모델 준비 후 아래에서
+    files = st.file_uploader("여러 이미지를 한 번에 업로드하세요",
+                             type=["jpg","png","jpeg","webp","tiff"], accept_multiple_files=True)
+    zips = st.file_uploader("또는 이미지가 담긴 zip 파일", type=["zip"], accept_multiple_files=True)
+    c1, c2 = st.columns(2)
+    batch_size = c1.slider("배치 크기", 1, 64, int(st.secrets.get("BATCH_SIZE", 16)))
+    workers = c2.slider("디코딩 스레드 수", 1, 16, min(4, os.cpu_count() or 1))
+
+    run_batch = st.button("일괄 분류 시작", disabled=not (files or zips))
+
 if new_bytes:
     st.session_state.img_bytes = new_bytes
 
+# ======================
+# 모델 준비 대기 (입력 화면은 이미 그려진 상태, 워밍업은 백그라운드에서 계속)
+# ======================
+with model_status.container():
+    with st.spinner("🤖 모델 로드 중..."):
+        try:
+            learner = startup.learner()
+        except Exception as e:
+            get_model_startup.clear()  # 다음 실행에서 다시 시도
+            st.error(f"모델을 불러오지 못했습니다: {e}")
+            st.stop()
+
+# 모델이 바뀌면(버전/파일 해시/백엔드) 캐시 키도 바뀜
+MODEL_ID = f"{MODEL_VERSION}:{startup.sha256[:16]}:{MODEL_BACKEND}"
+engine, backend_report = get_inference_engine(MODEL_ID, MODEL_BACKEND, learner, startup.sha256, startup.threads)
+service = get_inference_service(MODEL_ID, engine,
+                                int(st.secrets.get("SERVICE_MAX_BATCH", 8)),
+                                float(st.secrets.get("SERVICE_MAX_WAIT_MS", 10)),
+                                int(st.secrets.get("SERVICE_MAX_QUEUE", 64)))
+pred_cache = get_prediction_cache(int(st.secrets.get("PRED_CACHE_ENTRIES", 64)),
+                                  int(st.secrets.get("PRED_CACHE_MB", 256)))
+
+# 확률 패널에 기본으로 보여 줄 상위 라벨 수
+TOP_K = int(st.secrets.get("TOP_K", 5))
+
+# 모델 입력 크기 근처로 줄여서 디코딩 (DECODE_DOWNSCALE=false면 원본 해상도)
+TARGET_SIZE = target_size_from_learner(learner) if st.secrets.get("DECODE_DOWNSCALE", True) else None
+
+labels = [str(x) for x in learner.dls.vocab]
+with model_status.container():
+    st.success("✅ 모델 로드 완료")
+    if backend_report and "error" in backend_report:
+        st.warning(f"`{MODEL_BACKEND}` 백엔드를 사용할 수 없어 eager 모델로 추론합니다: {backend_report['error']}")
+    if startup.parity_errors:
+        st.warning("추론 경로 결과가 `learner.predict`와 다릅니다: " + "; ".join(startup.parity_errors))
+    st.write(f"**분류 가능한 항목:** `{', '.join(labels)}`")
+    st.markdown("---")
+
+# ======================
+# 일괄 분류 실행
+# ======================
+with tab_batch:
+    if run_batch:
+        items, errors = expand_uploads([(u.name, u.getvalue()) for u in (files or []) + (zips or [])])
+        skipped, rows, done = len(errors), [], 0  # skipped: zip에서 건너뛴 항목 (items에 포함되지 않음)
+        progress = st.progress(0.0, text=f"0 / {len(items)}")
+        table = st.empty()
+        t0 = time.perf_counter()
+        try:
+            for batch_rows, batch_errors in classify_in_batches(service, items, lambda b: decode_for_model(b, TARGET_SIZE),
+                                                                batch_size=batch_size, workers=workers, timeout=60):
+                rows += batch_rows
+                errors += batch_errors
+                done = len(rows) + len(errors) - skipped
+                progress.progress(done / max(len(items), 1), text=f"{done} / {len(items)}")
+                table.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+        except (QueueFullError, FutureTimeoutError):
+            st.error(f"요청이 많아 {len(items) - done}장은 처리하지 못했습니다. 잠시 후 다시 시도해 주세요.")
+        elapsed = time.perf_counter() - t0
+        st.session_state.batch_rows = rows
+        st.success(f"✅ {len(rows)}장 분류 완료 — {elapsed:.2f}초, {len(rows) / max(elapsed, 1e-9):.1f} images/sec")
+        for name, err in errors:
+            st.warning(f"`{name}` 처리 실패: {err}")
+
+    if st.session_state.batch_rows:
+        df = pd.DataFrame(st.session_state.batch_rows)
+        if not run_batch:  # 방금 실행한 경우엔 위에서 스트리밍한 표가 이미 있음
+            st.dataframe(df, use_container_width=True, hide_index=True)
+        d1, d2 = st.columns(2)
+        d1.download_button("CSV 다운로드", df.to_csv(index=False).encode("utf-8-sig"),
+                           file_name="predictions.csv", mime="text/csv")
+        d2.download_button("JSON 다운로드", df.to_json(orient="records", force_ascii=False).encode("utf-8"),
+                           file_name="predictions.json", mime="application/json")
+
 # ======================
 # 예측 & 레이아웃
 # ======================
 if st.session_state.img_bytes:
+    t_request = time.perf_counter()
     top_l, top_r = st.columns([1, 1], vertical_alignment="center")
 
-    pil_img = load_pil_from_bytes(st.session_state.img_bytes)
+    # 같은 이미지(같은 모델)는 디코딩/추론 없이 캐시에서 바로 꺼냄 (캐시에는 표시용 썸네일만 보관)
+    with metrics.timer("cache_lookup"):
+        cache_key = make_cache_key(st.session_state.img_bytes, MODEL_ID)
+        cached = pred_cache.get(cache_key)
+    if cached:
+        thumb, (pred, pred_idx, probs) = cached
+    else:
+        with metrics.timer("decode"):
+            pil_img, thumb = ingest(st.session_state.img_bytes, TARGET_SIZE)
     with top_l:
-        st.image(pil_img, caption="입력 이미지", use_container_width=True)
+        st.image(thumb, caption="입력 이미지", use_container_width=True)
 
-    with st.spinner("🧠 분석 중..."):
-        pred, pred_idx, probs = learner.predict(PILImage.create(np.array(pil_img)))
-        st.session_state.last_prediction = str(pred)
+    if not cached:
+        with st.spinner("🧠 분석 중..."):
+            try:
+                with metrics.timer("predict"):
+                    pred, pred_idx, probs = service.predict(pil_img, timeout=60)
+            except (QueueFullError, FutureTimeoutError):
+                st.error("요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.")
+                st.stop()
+        startup.mark("first_prediction")
+        pred_cache.put(cache_key, thumb, (pred, pred_idx, probs))
+    st.session_state.last_prediction = str(pred)
 
     with top_r:
         st.markdown(
@@ -160,28 +284,14 @@ if st.session_state.img_bytes:
 
     left, right = st.columns([1,1], vertical_alignment="top")
 
-    # 왼쪽: 확률 막대
+    # 왼쪽: 확률 막대 (상위 TOP_K만 기본 표시, 전체 목록은 토글을 켰을 때만 만들어 전송)
     with left:
         st.subheader("상세 예측 확률")
-        prob_list = sorted(
-            [(labels[i], float(probs[i])) for i in range(len(labels))],
-            key=lambda x: x[1], reverse=True
-        )
-        for lbl, p in prob_list:
-            pct = p * 100
-            hi = "highlight" if lbl == st.session_state.last_prediction else ""
-            st.markdown(
-                f"""
-                <div class="prob-card">
-                  <div style="display:flex;justify-content:space-between;margin-bottom:6px;">
-                    <strong>{lbl}</strong><span>{pct:.2f}%</span>
-                  </div>
-                  <div class="prob-bar-bg">
-                    <div class="prob-bar-fg {hi}" style="width:{pct:.4f}%;"></div>
-                  </div>
-                </div>
-                """, unsafe_allow_html=True
-            )
+        show_all = len(labels) > TOP_K and st.toggle(f"전체 보기 ({len(labels)}개 라벨)", key="show_all_probs")
+        with metrics.timer("probabilities"):
+            rows = [(labels[i], p) for i, p in top_k(probs, None if show_all else TOP_K)]
+        with metrics.timer("render_probs"):
+            st.markdown(prob_panel_html(rows, st.session_state.last_prediction), unsafe_allow_html=True)
 
     # 오른쪽: 정보 패널 (예측 라벨 기본, 다른 라벨로 바꿔보기 가능)
     with right:
@@ -189,57 +299,44 @@ if st.session_state.img_bytes:
         default_idx = labels.index(st.session_state.last_prediction) if st.session_state.last_prediction in labels else 0
         info_label = st.selectbox("표시할 라벨 선택", options=labels, index=default_idx)
 
-        texts, images, videos = get_content_for_label(info_label)
-
-        if not any([texts, images, videos]):
-            st.info(f"라벨 `{info_label}`에 대한 콘텐츠가 아직 없습니다. 코드의 CONTENT_BY_LABEL에 추가하세요.")
-        else:
-            # 텍스트
-            if texts:
-                st.markdown('<div class="info-grid">', unsafe_allow_html=True)
-                for t in texts:
-                    st.markdown(f"""
-                    <div class="card" style="grid-column:span 12;">
-                      <h4>텍스트</h4>
-                      <div>{t}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            # 이미지(최대 3, 3열)
-            if images:
-                st.markdown('<div class="info-grid">', unsafe_allow_html=True)
-                for url in images[:3]:
-                    st.markdown(f"""
-                    <div class="card" style="grid-column:span 4;">
-                      <h4>이미지</h4>
-                      <img src="{url}" class="thumb" />
-                    </div>
-                    """, unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-
-            # 동영상(유튜브 썸네일)
-            if videos:
-                st.markdown('<div class="info-grid">', unsafe_allow_html=True)
-                for v in videos[:3]:
-                    thumb = yt_thumb(v)
-                    if thumb:
-                        st.markdown(f"""
-                        <div class="card" style="grid-column:span 6;">
-                          <h4>동영상</h4>
-                          <a href="{v}" target="_blank" class="thumb-wrap">
-                            <img src="{thumb}" class="thumb"/>
-                            <div class="play"></div>
-                          </a>
-                          <div class="helper">{v}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"""
-                        <div class="card" style="grid-column:span 6;">
-                          <h4>동영상</h4>
-                          <a href="{v}" target="_blank">{v}</a>
-                        </div>
-                        """, unsafe_allow_html=True)
+        with metrics.timer("render_content"):
+            texts, images, videos = get_content_for_label(info_label)
+            if not any([texts, images, videos]):
+                st.info(f"라벨 `{info_label}`에 대한 콘텐츠가 아직 없습니다. content/manifest.json에 추가하세요.")
+            else:
+                # 텍스트(12열) + 이미지(최대 3, 4열씩) + 동영상(유튜브 썸네일, 6열씩)을 하나의 그리드로
+                st.markdown(content_panel_html(tuple(texts), tuple(images), tuple(videos)), unsafe_allow_html=True)
+    metrics.observe("request_total", (time.perf_counter() - t_request) * 1000)
 else:
     st.info("카메라로 촬영하거나 파일을 업로드하면 분석 결과와 라벨별 콘텐츠가 표시됩니다.")
+
+# ======================
+# 사이드바: 성능 패널 (단계별 지연 시간, 캐시/서비스/시작 상태)
+# ======================
+with st.sidebar.expander("⏱️ 성능", expanded=False):
+    snap = metrics.snapshot()
+    if snap:
+        st.dataframe(
+            pd.DataFrame([{"단계": k, "n": v["count"], "p50 ms": v["p50_ms"], "p95 ms": v["p95_ms"],
+                           "max ms": v["max_ms"]} for k, v in snap.items()]).round(1),
+            use_container_width=True, hide_index=True,
+        )
+    _cs = pred_cache.stats()
+    st.caption(
+        f"예측 캐시: 적중 {_cs['hits']} · 미스 {_cs['misses']} · 적중률 {_cs['hit_rate']:.0%} · "
+        f"{_cs['entries']}개 / {_cs['bytes'] / 1e6:.1f} MB"
+    )
+    if backend_report and "error" not in backend_report:
+        st.caption(
+            f"백엔드 `{MODEL_BACKEND}`: top-1 일치 {backend_report['top1_agreement']:.1%} · "
+            f"최대 확률 차 {backend_report['max_prob_drift']:.4f} (n={backend_report['n']})"
+        )
+    st.caption("시작 단계(초): " + " · ".join(f"{k} {v:.2f}" for k, v in startup.timings.items()))
+    _ss = service.stats()
+    st.caption(
+        f"추론 서비스: 대기 {_ss['queued']} · 처리 {_ss['submitted']} · 거절 {_ss['rejected']} · "
+        f"평균 배치 {_ss['avg_batch_size']:.1f}"
+    )
+
+if METRICS_FILE:
+    metrics.write(METRICS_FILE, min_interval=float(st.secrets.get("METRICS_INTERVAL_S", 10)))